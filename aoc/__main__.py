@@ -0,0 +1,140 @@
+import argparse
+import sys
+from pathlib import Path
+from typing import Optional, Sequence
+
+from aoc.inputs import InputStore
+from aoc.runner import (PARTS, TimingHistory, discover_days, format_results,
+                        input_path, run)
+
+
+def day_list(value: str) -> list[int]:
+    """
+    Parse a comma-separated list of days and inclusive ranges.
+    day_list('1,3-5') -> [1, 3, 4, 5]
+    """
+    days: list[int] = []
+    for item in value.split(','):
+        start, _, end = item.partition('-')
+        days.extend(range(int(start), int(end or start) + 1))
+    return days
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m aoc')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser(
+        'run', help='Run and profile solvers against local input files.')
+    run_parser.add_argument(
+        'days',
+        nargs='*',
+        type=day_list,
+        help='Days to run, e.g. "1 15 19" or "1-5,9". Defaults to all days.')
+    run_parser.add_argument('-p',
+                            '--part',
+                            dest='parts',
+                            action='append',
+                            type=int,
+                            choices=PARTS,
+                            help='Part to run. May be repeated.')
+    run_parser.add_argument(
+        '-i',
+        '--input-dir',
+        type=Path,
+        help='Directory containing dayNN.txt input files. Defaults to the '
+        'local input store.')
+    run_parser.add_argument(
+        '--offline',
+        action='store_true',
+        default=None,
+        help='Fail instead of downloading inputs missing from the store.')
+    run_parser.add_argument(
+        '-j',
+        '--jobs',
+        type=int,
+        default=1,
+        help='Run parts in this many processes, slowest first (0 for one '
+        'per CPU).')
+    run_parser.add_argument(
+        '--no-tracemalloc',
+        dest='trace_memory',
+        action='store_false',
+        help='Skip allocation tracing, which inflates wall times.')
+    run_parser.add_argument(
+        '--max-time',
+        type=float,
+        help='Exit with an error if any part takes longer (in seconds).')
+
+    cache_parser = commands.add_parser('cache',
+                                       help='Populate the local input store.')
+    cache_parser.add_argument('days',
+                              nargs='*',
+                              type=day_list,
+                              help='Days to cache. Defaults to all days.')
+    cache_parser.add_argument(
+        '--from-dir',
+        type=Path,
+        help='Copy dayNN.txt files from this directory instead of '
+        'downloading them.')
+    cache_parser.add_argument('--verify',
+                              action='store_true',
+                              help='Check cached inputs against their digest.')
+    return parser
+
+
+def cache(days: Sequence[int], from_dir: Optional[Path], verify: bool) -> int:
+    store = InputStore()
+    status = 0
+    for day in days:
+        if verify:
+            if not store.verify(day):
+                print(f'day {day}: missing or corrupt', file=sys.stderr)
+                status = 1
+            continue
+        if from_dir is not None:
+            path = input_path(from_dir, day)
+            if not path.is_file():
+                continue
+            content_digest = store.put(day, path.read_bytes())
+        elif day in store:
+            continue
+        else:
+            store.fetch(day)
+            content_digest = store.digest_path(day).read_text().strip()
+        print(f'day {day}: {content_digest} {store.path(day)}')
+    return status
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    days = [d for group in args.days for d in group] or list(discover_days())
+    if args.command == 'cache':
+        return cache(days, args.from_dir, args.verify)
+
+    results = run(days,
+                  args.parts or PARTS,
+                  args.input_dir,
+                  args.trace_memory,
+                  offline=args.offline,
+                  jobs=args.jobs,
+                  history=TimingHistory())
+    print(format_results(results))
+
+    status = 0
+    if not all(r.ok for r in results):
+        status = 1
+    if args.max_time is not None:
+        slow = [r for r in results if r.wall_time > args.max_time]
+        for r in slow:
+            print(
+                f'day {r.day} part {r.part} took {r.wall_time:.3f}s, '
+                f'over the {args.max_time}s limit.',
+                file=sys.stderr)
+        if slow:
+            status = 1
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
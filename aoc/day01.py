@@ -1,27 +1,70 @@
-from itertools import pairwise
-from typing import Tuple, Generator
+from collections import deque
+from itertools import islice
+from typing import IO, Iterable, Iterator
 
-from aocd.models import Puzzle
+import numpy as np
 
+from aoc.inputs import Puzzle, read_line_chunks
+"""
+Consecutive windows of k depths share all but their first and last readings,
+so a window sum increases exactly when depths[i + k] > depths[i]. None of
+the window sums need computing, and only the last k readings are needed.
+"""
 
-def triplewise(iterable) -> Generator[Tuple, None, None]:
+
+def parse(input_data: str) -> np.ndarray:
+    return np.fromstring(input_data, dtype=np.int64, sep='\n')
+
+
+def count_increases(depths: Iterable[int], window: int = 1) -> int:
+    """
+    Count the increases in the sum of a sliding window over a stream of
+    depths, holding only one window in memory.
+    """
+    assert window >= 1, 'window must be at least 1.'
+    it = iter(depths)
+    recent = deque(islice(it, window), maxlen=window)
+    increases = 0
+    for depth in it:
+        increases += recent[0] < depth
+        recent.append(depth)
+    return increases
+
+
+def count_increases_array(depths: np.ndarray, window: int = 1) -> int:
+    assert window >= 1, 'window must be at least 1.'
+    return int(np.count_nonzero(depths[window:] > depths[:-window]))
+
+
+def count_increases_chunked(chunks: Iterable[np.ndarray],
+                            window: int = 1) -> int:
+    """
+    Like count_increases_array, over an array that arrives in chunks. The
+    last window readings of each chunk are carried over to the next.
+    """
+    tail = np.empty(0, dtype=np.int64)
+    increases = 0
+    for chunk in chunks:
+        depths = np.concatenate((tail, chunk))
+        increases += count_increases_array(depths, window)
+        tail = depths[-window:]
+    return increases
+
+
+def read_chunks(f: IO[str], chunk_size: int = 1 << 20) -> Iterator[np.ndarray]:
     """
-    Return overlapping triplets from an iterable.
-    triplewise('ABCDEFG') -> ABC BCD CDE DEF EFG
+    Read depths from a text file in arrays, one for each piece of about
+    chunk_size characters.
     """
-    for (a, _), (b, c) in pairwise(pairwise(iterable)):
-        yield a, b, c
+    return (parse(text) for text in read_line_chunks(f, chunk_size))
 
 
 def part1(input_data: str) -> int:
-    depths = [int(n) for n in input_data.splitlines()]
-    return sum((a < b) for a, b in pairwise(depths))
+    return count_increases_array(parse(input_data), window=1)
 
 
-def part2(input_data):
-    depths = [int(n) for n in input_data.splitlines()]
-    triplet_sums = (sum(t) for t in triplewise(depths))
-    return sum((a < b) for a, b in pairwise(triplet_sums))
+def part2(input_data: str) -> int:
+    return count_increases_array(parse(input_data), window=3)
 
 
 if __name__ == '__main__':
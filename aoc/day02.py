@@ -1,51 +1,83 @@
 from dataclasses import dataclass
-from typing import Dict, Union
+from typing import IO, Iterable, Iterator
 
-from aocd.models import Puzzle
+import numpy as np
+
+from aoc.inputs import Puzzle, read_line_chunks
+"""
+Commands are parsed into parallel arrays of opcodes (the first byte of each
+command) and magnitudes. Aim is then the cumulative sum of down/up, and the
+depth under part 2's rules is the sum of forward * aim, so neither part needs
+a Python-level loop over the course.
+"""
+
+FORWARD, DOWN, UP = ord('f'), ord('d'), ord('u')
+OPCODES = (FORWARD, DOWN, UP)
+COMMAND_LETTERS = b'forwadnup'
+
+Commands = tuple[np.ndarray, np.ndarray]
+"""(opcodes, magnitudes)"""
+
+
+def parse(input_data: str) -> Commands:
+    data = input_data.strip().encode('ascii')
+    if not data:
+        return np.empty(0, dtype=np.uint8), np.empty(0, dtype=np.int64)
+    buffer = np.frombuffer(data, dtype=np.uint8)
+    line_starts = np.concatenate(
+        ([0], np.flatnonzero(buffer == ord('\n')) + 1))
+    opcodes = buffer[line_starts]
+    # With the command words removed only the magnitudes are left.
+    magnitudes = np.fromstring(data.translate(None, COMMAND_LETTERS),
+                               dtype=np.int64,
+                               sep=' ')
+    if len(magnitudes) != len(opcodes) or not np.isin(opcodes, OPCODES).all():
+        raise ValueError('Unrecognised command in course.')
+    return opcodes, magnitudes
 
 
 @dataclass
-class Position:
-    x: int = 0
-    y: int = 0
+class Course:
+    horizontal: int = 0
+    aim: int = 0
+    """Also the depth under part 1's rules."""
+    depth: int = 0
+
+    def update(self, opcodes: np.ndarray, magnitudes: np.ndarray) -> None:
+        """Follow a batch of commands, continuing from the current position."""
+        forward = np.where(opcodes == FORWARD, magnitudes, 0)
+        vertical = (np.where(opcodes == DOWN, magnitudes, 0) -
+                    np.where(opcodes == UP, magnitudes, 0))
+        aim = self.aim + np.cumsum(vertical)
+        self.horizontal += int(forward.sum())
+        self.depth += int(forward @ aim)
+        if len(aim):
+            self.aim = int(aim[-1])
 
-    def add(self, delta: 'Position') -> 'Position':
-        return Position(self.x + delta.x, self.y + delta.y)
 
-    def scale(self, scalar: Union[int, str]) -> 'Position':
-        return Position(self.x * int(scalar), self.y * int(scalar))
+def follow(batches: Iterable[Commands]) -> Course:
+    course = Course()
+    for opcodes, magnitudes in batches:
+        course.update(opcodes, magnitudes)
+    return course
 
 
-direction_map: Dict[str, Position] = {
-    'forward': Position(1, 0),
-    'down': Position(0, 1),
-    'up': Position(0, -1),
-}
+def read_chunks(f: IO[str], chunk_size: int = 1 << 20) -> Iterator[Commands]:
+    """
+    Read commands from a text file in batches, one for each piece of about
+    chunk_size characters.
+    """
+    return (parse(text) for text in read_line_chunks(f, chunk_size))
 
 
 def part1(input_data: str) -> int:
-    current_position = Position()
-    for line in input_data.splitlines():
-        command, scalar = line.split()
-        delta = direction_map[command].scale(scalar)
-        current_position = current_position.add(delta)
-    return current_position.x * current_position.y
+    course = follow([parse(input_data)])
+    return course.horizontal * course.aim
 
 
 def part2(input_data: str) -> int:
-    current_position = Position()
-    aim = 0
-    for line in input_data.splitlines():
-        command, param = line.split()
-        scalar = int(param)
-        if command == 'down':
-            aim += scalar
-        elif command == 'up':
-            aim -= scalar
-        elif command == 'forward':
-            current_position = current_position.add(
-                Position(scalar, aim * scalar))
-    return current_position.x * current_position.y
+    course = follow([parse(input_data)])
+    return course.horizontal * course.depth
 
 
 if __name__ == '__main__':
@@ -1,58 +1,44 @@
-from functools import reduce
-from typing import List
+import numpy as np
 
-from aocd.models import Puzzle
+from aoc.grid import parse_digits
+from aoc.inputs import Puzzle
 
 
-def part1(input_data: str) -> int:
-    lines = input_data.splitlines()
-    column = columnar_sum(lines)
-    gamma_rate = ''.join('1' if count >= (len(lines) / 2) else '0'
-                         for count in column)
-    epsilon_rate = ''.join('0' if bit == '1' else '1' for bit in gamma_rate)
-    return multiply_bin(gamma_rate, epsilon_rate)
+def parse(input_data: str) -> np.ndarray:
+    """The report as a (lines x width) matrix of bits."""
+    return parse_digits(input_data) == 1
 
 
-def columnar_sum(lines: List[str]) -> List[int]:
-    column_sums = [0] * len(lines[0])
-    for line in lines:
-        bits = [int(bit) for bit in line]
-        column_sums = [(a + b) for (a, b) in zip(column_sums, bits)]
-    return column_sums
+def to_int(bits: np.ndarray) -> int:
+    """Read a row of bits, most significant first, as an int of any width."""
+    padding = -len(bits) % 8
+    return int.from_bytes(np.packbits(bits).tobytes(), 'big') >> padding
 
 
-def multiply_bin(*binary: str) -> int:
-    return reduce(lambda x, y: x * y, (int(b, 2) for b in binary))
+def part1(input_data: str) -> int:
+    report = parse(input_data)
+    ones = np.count_nonzero(report, axis=0)
+    gamma_rate = ones >= len(report) / 2
+    epsilon_rate = ~gamma_rate
+    return to_int(gamma_rate) * to_int(epsilon_rate)
+
+
+def rating(report: np.ndarray, most_common: bool) -> int:
+    rows = np.arange(len(report))
+    for col in range(report.shape[1]):
+        column = report[rows, col]
+        ones_most_common = np.count_nonzero(column) >= len(rows) / 2
+        rows = rows[column == (ones_most_common == most_common)]
+        if len(rows) == 1:
+            break
+    return to_int(report[rows[0]])
 
 
 def part2(input_data: str) -> int:
-    lines = input_data.splitlines()
-    word_size = len(lines[0])
-
-    sample = list(lines)
-    for col in range(word_size):
-        count = columnar_sum([line[col] for line in sample])[0]
-        ones_most_common = count >= len(sample) / 2
-        sample = [
-            line for line in sample if line[col] == str(int(ones_most_common))
-        ]
-        if len(sample) == 1:
-            break
-    oxygen_generator_rating = sample[0]
-
-    sample = list(lines)
-    for col in range(word_size):
-        count = columnar_sum([line[col] for line in sample])[0]
-        ones_most_common = count >= len(sample) / 2
-        sample = [
-            line for line in sample
-            if line[col] == ('0' if ones_most_common else '1')
-        ]
-        if len(sample) == 1:
-            break
-    co2_scrubber_rating = sample[0]
-
-    return multiply_bin(oxygen_generator_rating, co2_scrubber_rating)
+    report = parse(input_data)
+    oxygen_generator_rating = rating(report, most_common=True)
+    co2_scrubber_rating = rating(report, most_common=False)
+    return oxygen_generator_rating * co2_scrubber_rating
 
 
 if __name__ == '__main__':
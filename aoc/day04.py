@@ -1,90 +1,96 @@
-from dataclasses import dataclass
-from typing import List, Sequence, Tuple, Union, ClassVar
+from typing import Dict, List, Tuple
 
-from aocd.models import Puzzle
+import numpy as np
 
+from aoc.inputs import Puzzle
 
-@dataclass
-class Cell:
-    value: int
-    isMarked: bool = False
 
-
-@dataclass
-class Board:
-    grid: List[Cell]
-    SIDE_LENGTH: ClassVar[int] = 5
-
-    @staticmethod
-    def from_list(cells: Union[Sequence[int], Sequence[str]]) -> 'Board':
-        assert len(cells) == Board.SIDE_LENGTH ** 2, \
-            f'must be a list of {Board.SIDE_LENGTH ** 2} cell values.'
-        return Board([Cell(int(n)) for n in cells])
-
-    def mark(self, value: int) -> None:
-        for cell in self.grid:
-            if cell.value == value:
-                cell.isMarked = True
-
-    def get_row(self, n: int) -> Sequence[Cell]:
-        assert 0 <= n < Board.SIDE_LENGTH, f'must be between [0 and {Board.SIDE_LENGTH}).'
-        start, end = Board.SIDE_LENGTH * n, Board.SIDE_LENGTH * (n + 1)
-        return self.grid[start:end]
-
-    def get_col(self, n: int) -> Sequence[Cell]:
-        assert 0 <= n < Board.SIDE_LENGTH, f'must be between [0 and {Board.SIDE_LENGTH}).'
-        seq = [
-            self.grid[Board.SIDE_LENGTH * row + n]
-            for row in range(Board.SIDE_LENGTH)
-        ]
-        return seq
-
-    def has_complete_row_or_col(self) -> bool:
-        for i in range(Board.SIDE_LENGTH):
-            if all(cell.isMarked for cell in self.get_row(i)):
-                return True
-            if all(cell.isMarked for cell in self.get_col(i)):
-                return True
-        return False
-
-    def sum_unmarked_cells(self) -> int:
-        return sum(cell.value for cell in self.grid if not cell.isMarked)
-
-
-def parse(input_data: str) -> Tuple[List[int], List[Board]]:
-    sequence_input, *boards_input = input_data.split('\n\n')
+def parse(input_data: str) -> Tuple[List[int], np.ndarray]:
+    """The called numbers, and the boards as a (boards x side x side) array."""
+    sequence_input, _, boards_input = input_data.strip().partition('\n\n')
     sequence = [int(n) for n in sequence_input.split(',')]
-    boards = []
-    for board_input in boards_input:
-        board = Board.from_list(board_input.split())
-        boards.append(board)
-    return sequence, boards
+    side = len(boards_input.split('\n', 1)[0].split())
+    cells = np.fromstring(boards_input, dtype=np.int64, sep=' ')
+    if side == 0 or len(cells) % (side * side):
+        raise ValueError('Every board must be a square of the same size.')
+    return sequence, cells.reshape(-1, side, side)
+
+
+class Bingo:
+    """
+    Plays any number of boards at once. Each number maps to the cells it
+    appears in, and each board counts the hits on every row and column, so a
+    call only touches the cells holding that number.
+    """
+
+    def __init__(self, boards: np.ndarray):
+        self.boards = boards
+        n_boards, self.side, _ = boards.shape
+        self.calls: List[int] = []
+        self.win_turns = np.full(n_boards, -1)
+        """The turn on which each board won, or -1 if it hasn't."""
+        cells = boards.ravel()
+        order = np.argsort(cells, kind='stable')
+        numbers, starts = np.unique(cells[order], return_index=True)
+        self._cells: Dict[int, np.ndarray] = dict(
+            zip(numbers.tolist(), np.split(order, starts[1:])))
+        self._row_hits = np.zeros(n_boards * self.side, dtype=np.int64)
+        self._col_hits = np.zeros(n_boards * self.side, dtype=np.int64)
+
+    def call(self, n: int) -> np.ndarray:
+        """Mark a number, returning the boards that win because of it."""
+        cells = self._cells.pop(n, None)
+        if cells is None:
+            # Not on any board, or already called.
+            return np.empty(0, dtype=np.int64)
+        turn = len(self.calls)
+        self.calls.append(n)
+        board, cell = np.divmod(cells, self.side * self.side)
+        row, col = np.divmod(cell, self.side)
+        playing = self.win_turns[board] < 0
+        board, row, col = board[playing], row[playing], col[playing]
+        rows, cols = board * self.side + row, board * self.side + col
+        np.add.at(self._row_hits, rows, 1)
+        np.add.at(self._col_hits, cols, 1)
+        won = (self._row_hits[rows] == self.side) | (self._col_hits[cols]
+                                                     == self.side)
+        winners = np.unique(board[won])
+        self.win_turns[winners] = turn
+        return winners
+
+    def play(self, sequence: List[int]) -> np.ndarray:
+        """Call every number, returning the turn each board won on."""
+        for n in sequence:
+            self.call(n)
+        return self.win_turns
+
+    def score(self, board: int) -> int:
+        turn = int(self.win_turns[board])
+        assert turn >= 0, f'board {board} has not won.'
+        cells = self.boards[board]
+        unmarked = ~np.isin(cells, self.calls[:turn + 1])
+        return int(cells[unmarked].sum()) * self.calls[turn]
+
+
+def winners_in_order(input_data: str) -> Tuple[Bingo, np.ndarray]:
+    """Play every board, returning the winning boards ordered by win turn."""
+    sequence, boards = parse(input_data)
+    bingo = Bingo(boards)
+    win_turns = bingo.play(sequence)
+    winners = np.flatnonzero(win_turns >= 0)
+    if not len(winners):
+        raise Exception('No winner')
+    return bingo, winners[np.argsort(win_turns[winners], kind='stable')]
 
 
 def part1(input_data: str) -> int:
-    sequence, boards = parse(input_data)
-    for call in sequence:
-        for board in boards:
-            board.mark(call)
-            if board.has_complete_row_or_col():
-                score = board.sum_unmarked_cells() * call
-                return score
-    raise Exception('No winner')
+    bingo, winners = winners_in_order(input_data)
+    return bingo.score(winners[0])
 
 
 def part2(input_data: str) -> int:
-    sequence, boards = parse(input_data)
-    for call in sequence:
-        for board in boards:
-            board.mark(call)
-            if board.has_complete_row_or_col():
-                if len(boards) > 1:
-                    # Remove this winning board
-                    boards = [b for b in boards if b != board]
-                else:
-                    score = board.sum_unmarked_cells() * call
-                    return score
-    raise Exception('No winner')
+    bingo, winners = winners_in_order(input_data)
+    return bingo.score(winners[-1])
 
 
 if __name__ == '__main__':
@@ -1,89 +1,212 @@
-import itertools
-from collections import defaultdict
-from dataclasses import dataclass
-from typing import Dict, Iterable, Generator, Any, Iterator
-
-from aocd.models import Puzzle
-
-
-@dataclass(frozen=True)
-class Point:
-    x: int
-    y: int
-
-
-@dataclass(frozen=True)
-class Line:
-    start: Point
-    end: Point
-
-    @staticmethod
-    def from_string(line: str) -> 'Line':
-        x1, y1, x2, y2 = (int(n) for n in line.replace(' -> ', ',').split(','))
-        return Line(Point(x1, y1), Point(x2, y2))
-
-    def is_horizontal(self) -> bool:
-        return self.start.y == self.end.y
-
-    def is_vertical(self) -> bool:
-        return self.start.x == self.end.x
-
-    def is_diagonal(self) -> bool:
-        return abs(self.start.x - self.end.x) == abs(self.start.y - self.end.y)
-
-    def walk(self) -> Generator[Point, Any, None]:
-        if self.is_horizontal():
-            leftmost, rightmost = sorted((self.start.x, self.end.x))
-            return (Point(x, self.start.y)
-                    for x in range(leftmost, rightmost + 1))
-        elif self.is_vertical():
-            bottom, top = sorted((self.start.y, self.end.y))
-            return (Point(self.start.x, y) for y in range(bottom, top + 1))
-        elif self.is_diagonal():
-            leftmost, rightmost = sorted((self.start.x, self.end.x))
-            bottom, top = sorted((self.start.y, self.end.y))
-            xs = [x for x in range(leftmost, rightmost + 1)]
-            ys = [y for y in range(bottom, top + 1)]
-            if self.start.x == xs[0] and not self.start.y == ys[0]:
-                ys.reverse()
-            if self.start.y == ys[0] and not self.start.x == xs[0]:
-                xs.reverse()
-            return (Point(x, y) for x, y in zip_longest_memo(xs, ys))
-        raise NotImplementedError('Unsupported operation')
-
-    def __iter__(self) -> Iterator[Point]:
-        return self.walk()
-
-
-def zip_longest_memo(iter1, iter2):
-    iter1_last, iter2_last = None, None
-    for a, b in itertools.zip_longest(iter1, iter2, fillvalue=None):
-        if a is None:
-            a = iter1_last
-        if b is None:
-            b = iter2_last
-        iter1_last, iter2_last = a, b
-        yield a, b
-
-
-def part1(input_data: str):
-    lines = (Line.from_string(l) for l in input_data.splitlines())
-    point_count: Dict[Point, int] = defaultdict(int)
-    for line in lines:
-        if not line.is_horizontal() and not line.is_vertical():
-            continue
-        for point in line:
-            point_count[point] += 1
-    return sum(1 for p, count in point_count.items() if count > 1)
-
-
-def part2(input_data: str):
-    lines = (Line.from_string(l) for l in input_data.splitlines())
-    point_count: Dict[Point, int] = defaultdict(int)
-    for line in lines:
-        for point in line:
-            point_count[point] += 1
-    return sum(1 for p, count in point_count.items() if count > 1)
+from typing import Tuple
+
+import numpy as np
+
+from aoc.inputs import Puzzle
+"""
+Lines are drawn into a dense grid by assigning to strided slices of its flat
+view: a step of 1 for horizontal lines, the grid width for vertical ones and
+the width +/- 1 for diagonals. When the coordinates span too large an area
+for that, overlaps are counted from the lines' intervals instead.
+"""
+
+HORIZONTAL, VERTICAL, DIAGONAL, ANTIDIAGONAL = range(4)
+"""
+Families of parallel lines: y is constant along a horizontal line, x along a
+vertical one, x - y along a diagonal and x + y along an antidiagonal.
+"""
+FAMILIES = (HORIZONTAL, VERTICAL, DIAGONAL, ANTIDIAGONAL)
+
+DENSE_LIMIT = 1 << 24
+"""The largest grid, in cells, to rasterise lines into."""
+BLOCK_SIZE = 1 << 22
+"""How many pairs of lines to intersect at a time."""
+
+
+def parse(input_data: str) -> np.ndarray:
+    """The lines as rows of x1, y1, x2, y2."""
+    numbers = input_data.replace(' -> ', ' ').replace(',', ' ')
+    return np.fromstring(numbers, dtype=np.int64, sep=' ').reshape(-1, 4)
+
+
+def classify(segments: np.ndarray) -> np.ndarray:
+    """The family of each line, or -1 if it is not at a multiple of 45°."""
+    dx = segments[:, 2] - segments[:, 0]
+    dy = segments[:, 3] - segments[:, 1]
+    return np.select(
+        [dy == 0, dx == 0, dx == dy, dx == -dy],
+        [HORIZONTAL, VERTICAL, DIAGONAL, ANTIDIAGONAL],
+        default=-1,
+    )
+
+
+def rasterise(segments: np.ndarray) -> np.ndarray:
+    """
+    Draw lines into a grid covering their bounding box, counting the lines
+    through each cell.
+    """
+    x0, y0 = segments[:, 0::2].min(), segments[:, 1::2].min()
+    x1, y1, x2, y2 = (segments - [x0, y0, x0, y0]).T
+    width = int(max(x1.max(), x2.max())) + 1
+    height = int(max(y1.max(), y2.max())) + 1
+    # Draw every line forwards through the flat grid.
+    backwards = (y1 > y2) | ((y1 == y2) & (x1 > x2))
+    x1, x2 = np.where(backwards, x2, x1), np.where(backwards, x1, x2)
+    y1, y2 = np.where(backwards, y2, y1), np.where(backwards, y1, y2)
+    starts, ends = y1 * width + x1, y2 * width + x2
+    steps = np.where(y2 > y1, width, 0) + np.sign(x2 - x1)
+    # A single cell still needs a non-zero step.
+    steps[steps == 0] = 1
+    grid = np.zeros(height * width, dtype=np.min_scalar_type(len(segments)))
+    for start, end, step in zip(starts.tolist(), ends.tolist(),
+                                steps.tolist()):
+        grid[start:end + 1:step] += 1
+    return grid.reshape(height, width)
+
+
+def intervals(segments: np.ndarray,
+              family: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    A line's key is the coordinate that is constant along it; lines with the
+    same key can only overlap as intervals of position, which is y for
+    vertical lines and x otherwise.
+    """
+    x1, y1, x2, y2 = segments.T
+    key = (y1, x1, x1 - y1, x1 + y1)[family]
+    t1, t2 = (y1, y2) if family == VERTICAL else (x1, x2)
+    return key, np.minimum(t1, t2), np.maximum(t1, t2)
+
+
+def position(x: np.ndarray, y: np.ndarray,
+             family: int) -> Tuple[np.ndarray, np.ndarray]:
+    """The key and position of cells relative to a family."""
+    key = (y, x, x - y, x + y)[family]
+    return key, y if family == VERTICAL else x
+
+
+def intersect(f: int, key_f: np.ndarray, g: int,
+              key_g: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Where the (infinite) lines of family f meet those of family g > f, as x,
+    y and whether the crossing is on a cell.
+    """
+    key_f, key_g = np.broadcast_arrays(key_f, key_g)
+    on_cell = np.ones(key_f.shape, dtype=bool)
+    if f == HORIZONTAL:
+        y = key_f
+        if g == VERTICAL:
+            x = key_g
+        elif g == DIAGONAL:
+            x = key_g + y
+        else:
+            x = key_g - y
+    elif f == VERTICAL:
+        x = key_f
+        y = x - key_g if g == DIAGONAL else key_g - x
+    else:
+        # A diagonal and an antidiagonal meet between cells when x - y and
+        # x + y differ in parity.
+        x, odd = np.divmod(key_f + key_g, 2)
+        y = x - key_f
+        on_cell = odd == 0
+    return x, y, on_cell
+
+
+def count_overlaps_sparse(segments: np.ndarray, families: np.ndarray) -> int:
+    """
+    Count the cells on more than one line without drawing them. Lines of one
+    family overlap only where their intervals do, so the cells covered twice
+    by a family are found by sweeping over interval endpoints. Cells covered
+    by more than one family are where lines cross, which are found pairwise.
+    A cell is then counted once for each family covering it twice, so those
+    counts are corrected at the crossings.
+    """
+    # With positions made non-negative and keys replaced by their rank among
+    # a family's keys, (key, position) pairs sort as single integers.
+    segments = segments - segments.min()
+    span = int(segments.max()) + 1
+    lines = [intervals(segments[families == f], f) for f in FAMILIES]
+    keys = [np.unique(key) for key, _, _ in lines]
+
+    covered_twice = 0
+    coverage = []
+    for f, (key, lo, hi) in enumerate(lines):
+        rank = np.searchsorted(keys[f], key)
+        starts, ends = rank * span + lo, rank * span + hi
+        edges = np.concatenate((starts, ends + 1))
+        order = np.argsort(edges, kind='stable')
+        depth = np.cumsum(np.repeat([1, -1], len(starts))[order])
+        lengths = np.diff(edges[order])
+        covered_twice += int(lengths[depth[:-1] >= 2].sum())
+        coverage.append((np.sort(starts), np.sort(ends)))
+
+    def lines_through(x: np.ndarray, y: np.ndarray, f: int) -> np.ndarray:
+        key, t = position(x, y, f)
+        rank = np.searchsorted(keys[f], key)
+        queries = rank * span + t
+        starts, ends = coverage[f]
+        n = (np.searchsorted(starts, queries, side='right') -
+             np.searchsorted(ends, queries, side='left'))
+        return np.where(np.isin(key, keys[f]), n, 0)
+
+    crossings = []
+    for f in FAMILIES:
+        for g in FAMILIES[f + 1:]:
+            key_f, lo_f, hi_f = lines[f]
+            key_g, lo_g, hi_g = lines[g]
+            if not len(key_f) or not len(key_g):
+                continue
+            rows = max(1, BLOCK_SIZE // len(key_g))
+            for i in range(0, len(key_f), rows):
+                block = slice(i, i + rows)
+                x, y, on_cell = intersect(f, key_f[block, None], g, key_g)
+                t_f, t_g = position(x, y, f)[1], position(x, y, g)[1]
+                on_cell &= ((lo_f[block, None] <= t_f) &
+                            (t_f <= hi_f[block, None]) & (lo_g <= t_g) &
+                            (t_g <= hi_g))
+                crossings.append(np.stack((x[on_cell], y[on_cell]), axis=1))
+    if not crossings:
+        return covered_twice
+    points = np.concatenate(crossings)
+    if not len(points):
+        return covered_twice
+
+    x, y = points.T
+    order = np.lexsort((y, x))
+    x, y = x[order], y[order]
+    distinct = np.concatenate(([True], (np.diff(x) != 0) | (np.diff(y) != 0)))
+    x, y = x[distinct], y[distinct]
+    counted = sum(lines_through(x, y, f) >= 2 for f in FAMILIES)
+    return covered_twice - int(np.sum(counted)) + len(x)
+
+
+def count_overlaps(segments: np.ndarray,
+                   diagonals: bool,
+                   dense_limit: int = DENSE_LIMIT) -> int:
+    families = classify(segments)
+    if diagonals:
+        if (families < 0).any():
+            raise ValueError(
+                'Lines must be horizontal, vertical or at 45 degrees.')
+        selected = families >= 0
+    else:
+        selected = (families == HORIZONTAL) | (families == VERTICAL)
+    segments, families = segments[selected], families[selected]
+    if not len(segments):
+        return 0
+    width = int(np.ptp(segments[:, 0::2])) + 1
+    height = int(np.ptp(segments[:, 1::2])) + 1
+    if width * height <= dense_limit:
+        return int(np.count_nonzero(rasterise(segments) > 1))
+    return count_overlaps_sparse(segments, families)
+
+
+def part1(input_data: str) -> int:
+    return count_overlaps(parse(input_data), diagonals=False)
+
+
+def part2(input_data: str) -> int:
+    return count_overlaps(parse(input_data), diagonals=True)
 
 
 if __name__ == '__main__':
@@ -1,6 +1,11 @@
-from typing import List
+from functools import lru_cache
+from typing import Iterable, List, Optional
 
-from aocd.models import Puzzle
+from aoc.inputs import Puzzle
+from aoc.matrix import MatrixPowers
+
+TIMERS = 9
+"""Timers run from 8 for a newborn fish down to 0."""
 
 
 def part1(input_data: str) -> int:
@@ -11,19 +16,53 @@ def part2(input_data: str) -> int:
     return model(input_data, iterations=256)
 
 
-def model(input_data: str, iterations: int = 80) -> int:
+def transition() -> List[List[int]]:
+    """
+    The matrix taking fish[j], the number of fish with timer j, to the
+    numbers on the next day.
+    """
+    matrix = [[0] * TIMERS for _ in range(TIMERS)]
+    for timer in range(1, TIMERS):
+        matrix[timer - 1][timer] = 1
+    # A fish whose timer is 0 resets to 6 and spawns a fish with timer 8.
+    matrix[6][0] = 1
+    matrix[8][0] = 1
+    return matrix
+
+
+@lru_cache(maxsize=4)
+def lanternfish(modulus: Optional[int] = None) -> MatrixPowers:
+    """
+    The powers of the transition, shared by every projection. Exact powers
+    for far horizons are large, so lanternfish.cache_clear() frees them.
+    """
+    return MatrixPowers(transition(), modulus)
+
+
+def parse(input_data: str) -> List[int]:
     # fish[i] represents the number of fish with internal timer i.
-    fish: List[int] = [0] * 9
+    fish: List[int] = [0] * TIMERS
     for timer in (int(n) for n in input_data.split(',')):
         fish[timer] += 1
-    day = 0
-    while day < iterations:
-        mitosing, *rest = fish
-        rest[6] += mitosing
-        fish = rest + [mitosing]
-        assert len(fish) == 9, "invariant: len(fish) must always be 9"
-        day += 1
-    return sum(fish)
+    return fish
+
+
+def project(input_data: str,
+            horizons: Iterable[int],
+            modulus: Optional[int] = None) -> List[int]:
+    """
+    The number of fish after each number of days, optionally modulo some
+    number. The populations grow by about 9% a day, so exact counts for
+    horizons much beyond 10^7 days are too large to be practical.
+    """
+    fish = parse(input_data)
+    powers = lanternfish(modulus)
+    totals = [int(powers.apply(days, fish).sum()) for days in horizons]
+    return totals if modulus is None else [t % modulus for t in totals]
+
+
+def model(input_data: str, iterations: int = 80) -> int:
+    return project(input_data, [iterations])[0]
 
 
 if __name__ == '__main__':
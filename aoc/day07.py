@@ -1,29 +1,108 @@
-from typing import Dict
+from typing import Callable
 
-from aocd.models import Puzzle
+import numpy as np
+
+from aoc.inputs import Puzzle
+
+CostFunction = Callable[[np.ndarray], np.ndarray]
+"""The fuel for each of an array of move distances."""
+
+
+def parse(input_data: str) -> np.ndarray:
+    return np.fromstring(input_data, dtype=np.int64, sep=',')
 
 
 def part1(input_data: str) -> int:
-    positions = [int(n) for n in input_data.split(',')]
-    return fuel_use(positions, move_cost=lambda x: x)
+    return median_cost(parse(input_data))
 
 
 def part2(input_data: str) -> int:
-    positions = [int(n) for n in input_data.split(',')]
-    return fuel_use(positions, move_cost=triangle_number)
+    return mean_cost(parse(input_data))
+
+
+def total_cost(positions: np.ndarray, target: int,
+               move_cost: CostFunction) -> int:
+    return int(move_cost(np.abs(positions - target)).sum())
+
+
+def linear_costs(positions: np.ndarray) -> np.ndarray:
+    """
+    The fuel to align every crab at each target from the lowest position to
+    the highest, at one unit of fuel per step. With a histogram of positions
+    the crabs at or below each target, and their sum, are prefix sums.
+    """
+    low = positions.min()
+    offsets = positions - low
+    counts = np.bincount(offsets)
+    targets = np.arange(len(counts))
+    at_or_below = np.cumsum(counts)
+    sum_at_or_below = np.cumsum(counts * targets)
+    above = len(positions) - at_or_below
+    sum_above = offsets.sum() - sum_at_or_below
+    return (targets * at_or_below - sum_at_or_below + sum_above -
+            targets * above)
+
+
+def triangle_costs(positions: np.ndarray) -> np.ndarray:
+    """
+    Like linear_costs, where the nth step costs n fuel. Moving d steps costs
+    (d ** 2 + d) / 2, and the sum of squared distances to each target t
+    expands to sum(p ** 2) - 2 * t * sum(p) + n * t ** 2.
+    """
+    low = positions.min()
+    offsets = positions - low
+    targets = np.arange(offsets.max() + 1)
+    squares = (np.square(offsets).sum() - 2 * targets * offsets.sum() +
+               len(offsets) * np.square(targets))
+    return (squares + linear_costs(positions)) // 2
+
+
+def median_cost(positions: np.ndarray) -> int:
+    """
+    The least fuel at one unit per step, which is spent aligning at the
+    median: moving away from it takes more crabs further than it brings
+    closer.
+    """
+    middle = (len(positions) - 1) // 2
+    median = int(np.partition(positions, middle)[middle])
+    return total_cost(positions, median, lambda d: d)
 
 
-def fuel_use(positions, move_cost=lambda x: x):
-    low, high = min(positions), max(positions) + 1
-    # fuel[i] is the fuel required to align all crabs to position i
-    fuel: Dict[int, int] = {i: 0 for i in range(low, high)}
-    for p in positions:
-        for target in range(low, high):
-            fuel[target] += move_cost(abs(p - target))
-    return min(fuel.values())
+def mean_cost(positions: np.ndarray) -> int:
+    """
+    The least fuel when the nth step costs n, which is spent aligning within
+    half a step of the mean position.
+    """
+    mean = int(positions.sum()) // len(positions)
+    return min(
+        total_cost(positions, target, triangle_number)
+        for target in (mean, mean + 1))
+
+
+def fuel_use(positions: np.ndarray,
+             move_cost: CostFunction = lambda d: d) -> int:
+    """
+    The least fuel to align every crab, for any convex move_cost. The total
+    is then convex in the target too, so a ternary search finds its minimum.
+    """
+    low, high = int(positions.min()), int(positions.max())
+    while high - low > 2:
+        third = (high - low) // 3
+        left, right = low + third, high - third
+        left_cost = total_cost(positions, left, move_cost)
+        right_cost = total_cost(positions, right, move_cost)
+        if left_cost < right_cost:
+            high = right - 1
+        elif left_cost > right_cost:
+            low = left + 1
+        else:
+            low, high = left, right
+    return min(
+        total_cost(positions, target, move_cost)
+        for target in range(low, high + 1))
 
 
-def triangle_number(n: int) -> int:
+def triangle_number(n: np.ndarray) -> np.ndarray:
     """
     0, 1, 3, 6, 10, ...
     """
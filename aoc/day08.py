@@ -1,90 +1,109 @@
-from dataclasses import dataclass, field
-from typing import List
+from typing import IO, Iterable, Iterator
 
-from aocd.models import Puzzle
+import numpy as np
+
+from aoc.inputs import Puzzle, read_line_chunks
 """
 1 is the only digit that uses 2 segments
 7 is the only digit that uses 3 segments
 4 is the only digit that uses 4 segments
 8 is the only digit that uses all 7 segments
-"""
-
-
-@dataclass
-class NoteEntry:
-    signal_patterns: List[str]
-    outputs: List[str]
-
-    @staticmethod
-    def from_string(s: str) -> 'NoteEntry':
-        sp, o = s.split(' | ')
-        return NoteEntry(sp.split(), o.split())
-
-
-@dataclass
-class Notes:
-    entries: List[NoteEntry] = field(default_factory=list)
 
+Each pattern is a 7-bit mask of its wires. Across the ten patterns of an
+entry, every wire lights up a fixed number of times whatever the wiring (the
+top segment in 8 digits, the bottom-right in 9, ...), so scoring a pattern by
+the sum of its wires' counts identifies the digit without solving the wiring.
+"""
 
-def parse(input_data: str) -> Notes:
-    lines = input_data.splitlines()
-    notes = Notes()
-    for line in lines:
-        ne = NoteEntry.from_string(line)
-        notes.entries.append(ne)
-    return notes
+PATTERNS, OUTPUTS = 10, 4
+SEGMENTS = 7
+
+WIRE_BITS = np.zeros(256, dtype=np.uint8)
+WIRE_BITS[np.frombuffer(b'abcdefg', dtype=np.uint8)] = 1 << np.arange(SEGMENTS)
+
+DIGIT_SCORES = {
+    42: 0,
+    17: 1,
+    34: 2,
+    39: 3,
+    30: 4,
+    37: 5,
+    41: 6,
+    25: 7,
+    49: 8,
+    45: 9
+}
+"""The score of each digit's pattern in an entry, as described above."""
+SCORE_DIGITS = np.full(max(DIGIT_SCORES) + 1, -1)
+SCORE_DIGITS[list(DIGIT_SCORES)] = list(DIGIT_SCORES.values())
+
+POPCOUNT = np.array([bin(mask).count('1') for mask in range(1 << SEGMENTS)])
+UNIQUE_LENGTHS = [2, 3, 4, 7]
+
+
+def parse(input_data: str) -> np.ndarray:
+    """
+    The entries as an (entries x 14) array of wire masks, the ten signal
+    patterns followed by the four outputs.
+    """
+    bits = WIRE_BITS[np.frombuffer(input_data.encode('ascii'), dtype=np.uint8)]
+    is_wire = bits > 0
+    word_starts = np.flatnonzero(is_wire[1:] & ~is_wire[:-1]) + 1
+    if len(is_wire) and is_wire[0]:
+        word_starts = np.concatenate(([0], word_starts))
+    if len(word_starts) % (PATTERNS + OUTPUTS):
+        raise ValueError(
+            f'Every entry must have {PATTERNS} patterns and {OUTPUTS} '
+            'outputs.')
+    if not len(word_starts):
+        return np.empty((0, PATTERNS + OUTPUTS), dtype=np.uint8)
+    # The separators between words have no wires, so OR-ing from the start
+    # of one word to the next gives the wires of each word.
+    masks = np.bitwise_or.reduceat(bits, word_starts)
+    return masks.reshape(-1, PATTERNS + OUTPUTS)
+
+
+def wires(masks: np.ndarray) -> np.ndarray:
+    """Unpack masks into a trailing axis of one 0 or 1 per wire."""
+    return np.unpackbits(masks[..., None], axis=-1,
+                         bitorder='little')[..., :SEGMENTS]
+
+
+def decode(entries: np.ndarray) -> np.ndarray:
+    """The four-digit value shown by each entry."""
+    patterns, outputs = entries[:, :PATTERNS], entries[:, PATTERNS:]
+    wire_counts = np.einsum('ijk->ik', wires(patterns))
+    scores = np.einsum('ijk,ik->ij', wires(outputs), wire_counts)
+    digits = SCORE_DIGITS[scores]
+    if (digits < 0).any():
+        raise ValueError('Unable to decode signal pattern to digit.')
+    return digits @ 10**np.arange(OUTPUTS - 1, -1, -1)
+
+
+def read_chunks(f: IO[str], chunk_size: int = 1 << 20) -> Iterator[np.ndarray]:
+    """
+    Read entries from a text file in batches, one for each piece of about
+    chunk_size characters.
+    """
+    return (parse(text) for text in read_line_chunks(f, chunk_size))
+
+
+def count_unique_lengths(batches: Iterable[np.ndarray]) -> int:
+    return sum(
+        int(np.isin(POPCOUNT[entries[:, PATTERNS:]], UNIQUE_LENGTHS).sum())
+        for entries in batches)
+
+
+def sum_outputs(batches: Iterable[np.ndarray]) -> int:
+    return sum(int(decode(entries).sum()) for entries in batches)
 
 
 def part1(input_data: str) -> int:
-    notes = parse(input_data)
-    count = 0
-    for entry in notes.entries:
-        for o in entry.outputs:
-            if len(o) in [2, 3, 4, 7]:
-                count += 1
-    return count
+    return count_unique_lengths([parse(input_data)])
 
 
 def part2(input_data: str) -> int:
-    notes = parse(input_data)
-    total = 0
-    for entry in notes.entries:
-        patterns = [set(sp) for sp in entry.signal_patterns]
-        outputs = [set(o) for o in entry.outputs]
-
-        # Length-unique digits can be identified immediately
-        one = next((p for p in patterns if len(p) == 2))
-        seven = next((p for p in patterns if len(p) == 3))
-        four = next((p for p in patterns if len(p) == 4))
-        eight = next((p for p in patterns if len(p) == 7))
-
-        decoded: List[str] = []
-        for o in outputs:
-            if o == one:
-                decoded.append('1')
-            elif o == seven:
-                decoded.append('7')
-            elif o == four:
-                decoded.append('4')
-            elif o == eight:
-                decoded.append('8')
-            elif len(o) == 5 and len(o & four) == 2:
-                decoded.append('2')
-            elif len(o) == 5 and len(o & seven) == 3:
-                decoded.append('3')
-            elif len(o) == 5 and len(o & four) == 3 and len(o & one) == 1:
-                decoded.append('5')
-            elif len(o) == 6 and len(o & four) == 4:
-                decoded.append('9')
-            elif len(o) == 6 and len(o & four) == 3 and len(o & one) == 1:
-                decoded.append('6')
-            elif len(o) == 6 and len(o & four) == 3 and len(o & one) == 2:
-                decoded.append('0')
-            else:
-                raise ValueError('Unable to decode signal pattern to digit.')
-        total += int(''.join(decoded))
-
-    return total
+    return sum_outputs([parse(input_data)])
 
 
 if __name__ == '__main__':
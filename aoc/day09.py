@@ -1,44 +1,79 @@
-from functools import reduce
-from typing import Tuple, List
+import math
 
-from aocd.models import Puzzle
-from networkx import Graph, grid_2d_graph, connected_components
+import numpy as np
 
+from aoc.grid import parse_digits
+from aoc.inputs import Puzzle
+"""
+Basins are the connected regions of heights below 9. Each row of a basin is
+made of runs of cells, so basins are found by joining the runs that touch
+the run above them rather than by visiting every cell.
+"""
 
-def parse(input_data: str) -> Graph:
-    lines = input_data.splitlines()
-    nrow = len(lines)
-    ncol = len(next(iter(lines)))
-    g: Graph = grid_2d_graph(nrow, ncol)
-    for row, line in enumerate(lines):
-        for col, digit in enumerate(line):
-            n = g.nodes.get((row, col))
-            n['height'] = int(digit)
-            n['risk'] = n['height'] + 1
-    return g
+
+def parse(input_data: str) -> np.ndarray:
+    """The heightmap as a (rows x cols) array."""
+    return parse_digits(input_data)
+
+
+def low_points(heights: np.ndarray) -> np.ndarray:
+    """A mask of the cells lower than all of their neighbours."""
+    padded = np.pad(heights, 1, constant_values=10)
+    centre = padded[1:-1, 1:-1]
+    return ((centre < padded[:-2, 1:-1]) & (centre < padded[2:, 1:-1]) &
+            (centre < padded[1:-1, :-2]) & (centre < padded[1:-1, 2:]))
+
+
+def connected_components(n: int, u: np.ndarray, v: np.ndarray) -> np.ndarray:
+    """
+    Label n nodes joined by edges u[i] -- v[i] with the smallest node in their
+    component. This is a union-find that merges every edge's components at
+    once, then compresses paths by pointer jumping until all labels are
+    roots, repeating until no edge joins two components.
+    """
+    labels = np.arange(n)
+    while True:
+        lu, lv = labels[u], labels[v]
+        joins = lu != lv
+        if not joins.any():
+            return labels
+        lu, lv = lu[joins], lv[joins]
+        smaller = np.minimum(lu, lv)
+        np.minimum.at(labels, lu, smaller)
+        np.minimum.at(labels, lv, smaller)
+        u, v = u[joins], v[joins]
+        while True:
+            jumped = labels[labels]
+            if np.array_equal(jumped, labels):
+                break
+            labels = jumped
+
+
+def basin_sizes(heights: np.ndarray) -> np.ndarray:
+    rows, cols = heights.shape
+    # A closed column at the end of each row stops runs wrapping around.
+    is_open = np.zeros((rows, cols + 1), dtype=bool)
+    is_open[:, :cols] = heights < 9
+    is_open = is_open.ravel()
+    run_starts = is_open & ~np.concatenate(([False], is_open[:-1]))
+    # The run each open cell belongs to.
+    run = np.cumsum(run_starts) - 1
+    run_lengths = np.bincount(run[is_open])
+    cells = np.flatnonzero(is_open[cols + 1:] & is_open[:-(cols + 1)])
+    below, above = run[cells + cols + 1], run[cells]
+    labels = connected_components(len(run_lengths), below, above)
+    sizes = np.bincount(labels, weights=run_lengths).astype(np.int64)
+    return sizes[sizes > 0]
 
 
 def part1(input_data: str) -> int:
-    g = parse(input_data)
-    total_risk = 0
-    for this, this_attr in g.nodes.items():
-        is_low_point = all(g.nodes[neighbour]['height'] > this_attr['height']
-                           for neighbour in g.neighbors(this))
-        if is_low_point:
-            total_risk += this_attr['risk']
-    return total_risk
+    heights = parse(input_data)
+    return int((heights[low_points(heights)] + 1).sum())
 
 
 def part2(input_data: str) -> int:
-    g = parse(input_data)
-    peaks: List[Tuple[int, int]] = []
-    for node, node_attr in g.nodes.items():
-        if node_attr['height'] == 9:
-            peaks.append(node)
-    g.remove_nodes_from(peaks)
-    components = sorted(connected_components(g), key=len)
-    top3 = components[-3:]
-    return reduce(lambda x, y: x * y, (len(c) for c in top3))
+    sizes = basin_sizes(parse(input_data))
+    return math.prod(int(s) for s in np.sort(sizes)[-3:])
 
 
 if __name__ == '__main__':
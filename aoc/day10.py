@@ -1,7 +1,7 @@
-import statistics
-from typing import List
+import heapq
+from typing import Iterable, List, Optional, Tuple
 
-from aocd.models import Puzzle
+from aoc.inputs import Puzzle
 
 chunk_pairs = {
     '[': ']',
@@ -10,54 +10,102 @@ chunk_pairs = {
     '<': '>',
 }
 
+error_points = {
+    ')': 3,
+    ']': 57,
+    '}': 1197,
+    '>': 25137,
+}
 
-def part1(input_data: str) -> int:
-    points = {
-        ')': 3,
-        ']': 57,
-        '}': 1197,
-        '>': 25137,
-    }
+completion_points = {
+    ')': 1,
+    ']': 2,
+    '}': 3,
+    '>': 4,
+}
+
+
+def scan(line: str,
+         stack: Optional[List[str]] = None) -> Tuple[Optional[str], str]:
+    """
+    Check a line in one pass, returning its first illegal character if it is
+    corrupt and otherwise the characters that would complete it. A stack can
+    be passed in to be reused between lines.
+    """
+    if stack is None:
+        stack = []
+    stack.clear()
+    for symbol in line:
+        closing = chunk_pairs.get(symbol)
+        if closing is not None:
+            stack.append(closing)
+        elif not stack or stack.pop() != symbol:
+            return symbol, ''
+    return None, ''.join(reversed(stack))
+
+
+def completion_score(completion: str) -> int:
     total_points = 0
-    for line in input_data.splitlines():
-        stack: List[str] = []
-        for symbol in line:
-            if symbol in chunk_pairs:
-                stack.append(chunk_pairs[symbol])
-                continue
-            if not stack:  # Line has extra close symbols
-                break
-            expected = stack.pop()
-            if symbol != expected:  # Line is corrupt
-                total_points += points[symbol]
+    for symbol in completion:
+        total_points = (total_points * 5) + completion_points[symbol]
     return total_points
 
 
+class RunningMedian:
+    """
+    The median of a stream of numbers, kept as a max-heap of the lower half
+    and a min-heap of the upper half so that each number costs O(log n).
+    """
+
+    def __init__(self) -> None:
+        self._lower: List[int] = []
+        """The lower half, negated."""
+        self._upper: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self._lower) + len(self._upper)
+
+    def add(self, n: int) -> None:
+        # The lower half holds the extra number when there are an odd number.
+        n = -heapq.heappushpop(self._lower, -n)
+        heapq.heappush(self._upper, n)
+        if len(self._upper) > len(self._lower):
+            heapq.heappush(self._lower, -heapq.heappop(self._upper))
+
+    def median(self) -> int:
+        """The middle number, or the two middle numbers' mean rounded down."""
+        if not self:
+            raise ValueError('median of an empty stream')
+        if len(self._lower) > len(self._upper):
+            return -self._lower[0]
+        return (-self._lower[0] + self._upper[0]) // 2
+
+
+def score(lines: Iterable[str]) -> Tuple[int, int]:
+    """
+    The total syntax error score of the corrupt lines and the middle
+    completion score of the incomplete ones, from a single pass over lines.
+    Lines may come straight from a file, which is then read one at a time.
+    """
+    stack: List[str] = []
+    error_score = 0
+    completion_scores = RunningMedian()
+    for line in lines:
+        illegal, completion = scan(line.rstrip('\n'), stack)
+        if illegal is not None:
+            error_score += error_points[illegal]
+        elif completion:
+            completion_scores.add(completion_score(completion))
+    middle = completion_scores.median() if completion_scores else 0
+    return error_score, middle
+
+
+def part1(input_data: str) -> int:
+    return score(input_data.splitlines())[0]
+
+
 def part2(input_data: str) -> int:
-    points = {
-        ')': 1,
-        ']': 2,
-        '}': 3,
-        '>': 4,
-    }
-    line_points: List[int] = []
-    for line in input_data.splitlines():
-        stack: List[str] = []
-        for symbol in line:
-            if symbol in chunk_pairs:
-                stack.append(chunk_pairs[symbol])
-                continue
-            if not stack:  # Line has extra close symbols
-                break
-            expected = stack.pop()
-            if symbol != expected:  # Line is corrupt
-                break
-        else:
-            total_points = 0
-            while stack:  # Line is incomplete.
-                total_points = (total_points * 5) + points[stack.pop()]
-            line_points.append(total_points)
-    return int(statistics.median(line_points))
+    return score(input_data.splitlines())[1]
 
 
 if __name__ == '__main__':
@@ -1,94 +1,109 @@
-import itertools
-from dataclasses import dataclass
-from typing import Dict, List
-
-from aocd.models import Puzzle
-
-
-@dataclass(frozen=True)
-class Coord:
-    row: int
-    col: int
-
-
-@dataclass
-class Octopus:
-    energy_level: int
-    has_flashed: bool = False
-
-    def increment_energy(self) -> None:
-        self.energy_level += 1
-
-    def is_ready_to_flash(self):
-        return not self.has_flashed and self.energy_level > 9
-
-    def reset_if_flashed(self) -> bool:
-        if self.has_flashed:
-            self.energy_level = 0
-            self.has_flashed = False
-            return True
-        return False
-
-
-def parse(input_data) -> Dict[Coord, Octopus]:
-    return {
-        Coord(row, col): Octopus(int(digit))
-        for row, line in enumerate(input_data.splitlines())
-        for col, digit in enumerate(line)
-    }
-
-
-def get_adjacent_coords(coord: Coord) -> List[Coord]:
-    product = itertools.product((-1, 0, 1), repeat=2)
-    delta = (p for p in product if p != (0, 0))
-    return [Coord(coord.row + d[0], coord.col + d[1]) for d in delta]
-
-
-def try_flash(cave: Dict[Coord, Octopus], coord: Coord) -> int:
-    o = cave[coord]
-    if not o.is_ready_to_flash():
-        return 0
-    o.has_flashed = True
-    total_flashes = 1
-    for a in get_adjacent_coords(coord):
-        if a not in cave:
-            continue
-        cave[a].increment_energy()
-        total_flashes += try_flash(cave, a)
-    return total_flashes
+from typing import Optional
+
+import numpy as np
+
+from aoc.grid import parse_digits
+from aoc.inputs import Puzzle
+"""
+The cave is kept as a flat array with a border of cells that can never
+flash, so the eight neighbours of any octopus are at fixed offsets and need
+no bounds checks. A step increments every octopus, then works through the
+cascade in waves: each wave adds one to the neighbours of the octopuses that
+have just flashed, and the next wave is whichever of those neighbours are
+newly over 9. Later waves are small, so they only touch the cells involved.
+"""
+
+BORDER = np.iinfo(np.int64).min // 2
+"""The energy of border cells, which no number of increments can make flash."""
+
+
+class Cave:
+
+    def __init__(self, energy: np.ndarray):
+        rows, cols = energy.shape
+        self.shape = energy.shape
+        padded = np.full((rows + 2, cols + 2), BORDER, dtype=np.int64)
+        padded[1:-1, 1:-1] = energy
+        self._flat = padded.ravel()
+        self._interior = padded[1:-1, 1:-1]
+        width = cols + 2
+        self._offsets = np.array([
+            -width - 1, -width, -width + 1, -1, 1, width - 1, width, width + 1
+        ])
+        self._flashed = np.zeros(len(self._flat), dtype=bool)
+        self._scratch = np.zeros(len(self._flat), dtype=np.int64)
+
+    @property
+    def energy(self) -> np.ndarray:
+        return self._interior
+
+    def step(self) -> int:
+        """Advance one step, returning how many octopuses flashed."""
+        energy, flashed = self._flat, self._flashed
+        energy += 1
+        ready = np.flatnonzero(energy > 9)
+        waves = []
+        while len(ready):
+            waves.append(ready)
+            flashed[ready] = True
+            neighbours = (ready[:, None] + self._offsets).ravel()
+            np.add.at(energy, neighbours, 1)
+            ready = neighbours[(energy[neighbours] > 9) & ~flashed[neighbours]]
+            # Keep one of each, by the last position each cell was written to.
+            positions = np.arange(len(ready))
+            self._scratch[ready] = positions
+            ready = ready[self._scratch[ready] == positions]
+        if not waves:
+            return 0
+        flashes = np.concatenate(waves)
+        energy[flashes] = 0
+        flashed[flashes] = False
+        return len(flashes)
+
+    def run(self, steps: int) -> int:
+        """Advance a number of steps, returning the total flashes."""
+        return sum(self.step() for _ in range(steps))
+
+    def first_sync(self, max_steps: Optional[int] = None) -> Optional[int]:
+        """
+        The number of steps until every octopus flashes at once, or None if
+        they never will. The cave's state after each step depends only on
+        the state before it, so once a state repeats the steps go round the
+        same cycle forever. Brent's algorithm spots the repeat by comparing
+        each state with a single saved one, saved again at every power of
+        two steps.
+        """
+        size = self.energy.size
+        saved = self.energy.copy()
+        power = cycle_length = 1
+        steps = 0
+        while max_steps is None or steps < max_steps:
+            steps += 1
+            if self.step() == size:
+                return steps
+            if np.array_equal(self.energy, saved):
+                return None
+            if cycle_length == power:
+                saved = self.energy.copy()
+                power *= 2
+                cycle_length = 0
+            cycle_length += 1
+        return None
+
+
+def parse(input_data: str) -> Cave:
+    return Cave(parse_digits(input_data))
 
 
 def part1(input_data: str) -> int:
-    cave = parse(input_data)
-    total_flashes = 0
-    for i in range(100):
-        # The energy level of each octopus increases by 1.
-        for o in cave.values():
-            o.increment_energy()
-        # Any octopus with an energy level greater than 9 flashes.
-        for coord in cave.keys():
-            total_flashes += try_flash(cave, coord)
-        # Any octopus that flashed during this step has its energy level set to 0.
-        for o in cave.values():
-            o.reset_if_flashed()
-    return total_flashes
+    return parse(input_data).run(100)
 
 
 def part2(input_data: str) -> int:
-    cave = parse(input_data)
-    iteration = 0
-    while True:
-        iteration += 1
-        # The energy level of each octopus increases by 1.
-        for o in cave.values():
-            o.increment_energy()
-        # Any octopus with an energy level greater than 9 flashes.
-        for coord in cave.keys():
-            try_flash(cave, coord)
-        # Any octopus that flashed during this step has its energy level set to 0.
-        resets = [o.reset_if_flashed() for o in cave.values()]
-        if all(resets):
-            return iteration
+    steps = parse(input_data).first_sync()
+    if steps is None:
+        raise ValueError('The octopuses never all flash at once.')
+    return steps
 
 
 if __name__ == '__main__':
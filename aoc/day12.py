@@ -1,8 +1,25 @@
-from typing import List, Callable
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, List, Tuple
 
-from aocd.models import Puzzle
 from networkx import from_edgelist, Graph
 
+from aoc.inputs import Puzzle
+"""
+Paths are counted over small caves only. Passing through a large cave can't
+change which caves may be visited next, so each large cave is replaced by
+direct passages between every pair of its neighbours (including from a cave
+back to itself), counted with multiplicity. Small caves get integer ids, the
+caves visited so far are a bitmask, and the number of ways to finish a path
+depends only on (cave, visited, may revisit one small cave), so it is
+memoised on those.
+"""
+
+START, END = 0, 1
+
+Passages = List[List[Tuple[int, int]]]
+"""For each small cave, the (small cave, number of ways) it leads to."""
+
 
 def parse(input_data) -> Graph:
     return from_edgelist(line.split('-') for line in input_data.splitlines())
@@ -12,49 +29,62 @@ def is_large_cave(name: str) -> bool:
     return all(c.isupper() for c in name)
 
 
-def count_paths_to_end(start: str, g: Graph, visited: List[str],
-                       can_visit: Callable[[str, List[str]], bool]) -> int:
-    visited = visited + [start]
-    if start == 'end':
-        return 1
-    n_paths_to_end = 0
-    for neighbour in g.neighbors(start):
-        if can_visit(neighbour, visited):
-            n_paths_to_end += count_paths_to_end(neighbour, g, visited,
-                                                 can_visit)
-    return n_paths_to_end
-
-
-def can_visit_part1(n: str, visited: List[str]) -> bool:
-    return is_large_cave(n) or n not in visited
-
-
-def can_visit_part2(n: str, visited: List[str]) -> bool:
-    if n == 'start':
-        return False
-    if is_large_cave(n):
-        return True
-    if n not in visited:
-        return True
-    small_caves = [c for c in visited if not is_large_cave(c)]
-    small_caves_visited_once = len(small_caves) == len(set(small_caves))
-    return small_caves_visited_once
+def compile_passages(g: Graph) -> Passages:
+    """Number the small caves, start and end first, and join them up."""
+    small = sorted((c for c in g if not is_large_cave(c)),
+                   key=lambda c: (c != 'start', c != 'end', c))
+    ids = {cave: i for i, cave in enumerate(small)}
+    ways: Dict[Tuple[int, int], int] = defaultdict(int)
+    for cave in g:
+        if not is_large_cave(cave):
+            for neighbour in g.neighbors(cave):
+                if not is_large_cave(neighbour):
+                    ways[ids[cave], ids[neighbour]] += 1
+            continue
+        if any(is_large_cave(n) for n in g.neighbors(cave)):
+            raise ValueError('Adjacent large caves allow infinitely many '
+                             'paths.')
+        for a in g.neighbors(cave):
+            for b in g.neighbors(cave):
+                ways[ids[a], ids[b]] += 1
+    passages: Passages = [[] for _ in small]
+    for (a, b), n in sorted(ways.items()):
+        # Paths never return to start or leave end.
+        if b != START and a != END:
+            passages[a].append((b, n))
+    return passages
+
+
+def count_paths(passages: Passages, may_revisit: bool) -> int:
+    """
+    The number of paths from start to end that visit each small cave at
+    most once, except for one small cave that may be visited twice if
+    may_revisit.
+    """
+
+    @lru_cache(maxsize=None)
+    def paths_to_end(cave: int, visited: int, may_revisit: bool) -> int:
+        if cave == END:
+            return 1
+        total = 0
+        for next_cave, ways in passages[cave]:
+            bit = 1 << next_cave
+            if not visited & bit:
+                total += ways * paths_to_end(next_cave, visited | bit,
+                                             may_revisit)
+            elif may_revisit and next_cave != END:
+                total += ways * paths_to_end(next_cave, visited, False)
+        return total
+
+    return paths_to_end(START, 1 << START, may_revisit)
 
 
 def part1(input_data: str) -> int:
-    g = parse(input_data)
-    return count_paths_to_end('start',
-                              g,
-                              visited=[],
-                              can_visit=can_visit_part1)
+    return count_paths(compile_passages(parse(input_data)), may_revisit=False)
 
 
 def part2(input_data: str) -> int:
-    g = parse(input_data)
-    return count_paths_to_end('start',
-                              g,
-                              visited=[],
-                              can_visit=can_visit_part2)
+    return count_paths(compile_passages(parse(input_data)), may_revisit=True)
 
 
 if __name__ == '__main__':
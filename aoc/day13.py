@@ -1,17 +1,18 @@
 from dataclasses import dataclass
-from typing import Set, Any, List, Tuple
+from typing import List, Tuple
 
-from aocd.models import Puzzle
+import numpy as np
 
+from aoc.inputs import Puzzle
+"""
+Dots are kept as an array of x coordinates and an array of y coordinates.
+Folding along x = n reflects every x beyond n to 2n - x, which is
+n - |x - n|, and leaves y alone, so the folds along each axis compose into a
+single lookup table from old coordinates to new ones.
+"""
 
-@dataclass(frozen=True)
-class Point:
-    x: int
-    y: int
-
-    def __post_init__(self):
-        if (self.x and self.x < 0) or (self.y and self.y < 0):
-            raise ValueError('Unexpected negative value.')
+Dots = Tuple[np.ndarray, np.ndarray]
+"""The x and y coordinates of each dot."""
 
 
 @dataclass(frozen=True)
@@ -26,53 +27,79 @@ class Line:
             raise ValueError('Unexpected negative value.')
 
 
-def parse(input_data: str) -> Tuple[Set[Point], List[Line]]:
+def parse(input_data: str) -> Tuple[Dots, List[Line]]:
     points_input, fold_input = input_data.split('\n\n')
-    points: Set[Point] = set()
-    for line in points_input.splitlines():
-        x, y = map(int, line.split(','))
-        points.add(Point(x, y))
+    coords = np.fromstring(points_input.replace(',', ' '),
+                           dtype=np.int64,
+                           sep=' ').reshape(-1, 2)
     folds: List[Line] = []
     for line in fold_input.splitlines():
         assert line.startswith('fold along ')
         axis, val = line.split()[-1].split('=')
         folds.append(Line(axis, int(val)))
-    return points, folds
+    return dedupe((coords[:, 0], coords[:, 1])), folds
 
 
-def xor(a: Any, b: Any) -> bool:
-    return bool(a) != bool(b)
+def dedupe(dots: Dots) -> Dots:
+    """
+    Remove repeated dots by packing each into a single int key, which also
+    sorts them by row.
+    """
+    xs, ys = dots
+    if not len(xs):
+        return dots
+    if xs.min() < 0 or ys.min() < 0:
+        raise ValueError('Unexpected negative value.')
+    width = int(xs.max()) + 1
+    keys = np.unique(ys * width + xs)
+    ys, xs = np.divmod(keys, width)
+    return xs, ys
 
 
-def points_to_str(points: Set[Point]) -> str:
-    x_max = max(p.x for p in points)
-    y_max = max(p.y for p in points)
-    plane = [['.' for _ in range(x_max + 1)] for _ in range(y_max + 1)]
-    for p in points:
-        plane[p.y][p.x] = '#'
-    return '\n'.join(''.join(y) for y in plane)
+def points_to_str(dots: Dots) -> str:
+    xs, ys = dots
+    # Each row ends in a column of newlines.
+    bitmap = np.full((ys.max() + 1, xs.max() + 2), ord('.'), dtype=np.uint8)
+    bitmap[:, -1] = ord('\n')
+    bitmap[ys, xs] = ord('#')
+    return bitmap.tobytes().decode('ascii')[:-1]
 
 
-def collapse(point: Point, along: Line) -> Point:
+def reflect(coords: np.ndarray, val: int) -> np.ndarray:
+    return val - np.abs(coords - val)
+
+
+def fold(dots: Dots, along: Line) -> Dots:
+    xs, ys = dots
     if along.axis == 'x':
-        return Point((along.val - abs(point.x - along.val)), point.y)
-    if along.axis == 'y':
-        return Point(point.x, (along.val - abs(point.y - along.val)))
-    raise ValueError(f'axis {along.axis=} not implemented')
+        return dedupe((reflect(xs, along.val), ys))
+    return dedupe((xs, reflect(ys, along.val)))
+
+
+def fold_all(dots: Dots, folds: List[Line]) -> Dots:
+    """
+    Apply every fold at once, by composing the folds along each axis into a
+    table mapping each coordinate to where it ends up.
+    """
+    xs, ys = dots
+    x_map, y_map = np.arange(xs.max() + 1), np.arange(ys.max() + 1)
+    for along in folds:
+        if along.axis == 'x':
+            x_map = reflect(x_map, along.val)
+        else:
+            y_map = reflect(y_map, along.val)
+    return dedupe((x_map[xs], y_map[ys]))
 
 
 def part1(input_data: str) -> int:
-    points, folds = parse(input_data)
-    first_fold = next(iter(folds))
-    points = set(collapse(p, first_fold) for p in points)
-    return len(points)
+    dots, folds = parse(input_data)
+    xs, _ = fold(dots, folds[0])
+    return len(xs)
 
 
 def part2(input_data: str) -> str:
-    points, folds = parse(input_data)
-    for fold in folds:
-        points = set(collapse(p, fold) for p in points)
-    return points_to_str(points)
+    dots, folds = parse(input_data)
+    return points_to_str(fold_all(dots, folds))
 
 
 if __name__ == '__main__':
@@ -1,8 +1,29 @@
 import itertools
 from collections import Counter
-from typing import Dict, Tuple
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
-from aocd.models import Puzzle
+from aoc.inputs import Puzzle
+from aoc.matrix import MatrixPowers
+"""
+Only the number of each pair of adjacent elements matters, and a step takes
+each pair to two new ones, so a step is a linear map on the pair counts. The
+rules are compiled once into that map over pair indices. With each pair
+going to only two, the steps of the puzzle are quickest taken one at a
+time, and the counts after very many steps come from powers of the map's
+matrix. Every element but the last is the first element of exactly one pair,
+which gives the element counts.
+"""
+
+DIRECT_STEPS = 10_000
+"""
+The most steps counted one at a time. A step costs a few operations per
+pair and a matrix squaring costs one per pair for every pair, so stepping is
+quicker until there are thousands of steps.
+"""
+
+Rules = Tuple[Tuple[str, str], ...]
+"""The pair insertion rules, in a form that can be cached on."""
 
 
 def parse(input_data) -> Tuple[str, Dict[str, str]]:
@@ -16,44 +37,107 @@ def parse(input_data) -> Tuple[str, Dict[str, str]]:
     return template, rules
 
 
-def polymerise(digraphs: Counter[str], rules: Dict[str, str]):
-    new_digraphs: Counter[str] = Counter()
-    for d, count in digraphs.items():
-        middle = rules[d]
-        new_digraphs[d[0] + middle] += count
-        new_digraphs[middle + d[1]] += count
-    return new_digraphs
+def successors(elements: str, rules: Rules) -> List[Tuple[int, ...]]:
+    """
+    The pairs each pair becomes after one step, both by index. The pair
+    (elements[i], elements[j]) has index i * len(elements) + j, and pairs
+    with no rule are left as they are.
+    """
+    index = {e: i for i, e in enumerate(elements)}
+    size = len(elements)
+    insertions = dict(rules)
+    result: List[Tuple[int, ...]] = []
+    for a, b in itertools.product(elements, repeat=2):
+        middle = insertions.get(a + b)
+        if middle is None:
+            result.append((index[a] * size + index[b], ))
+        else:
+            result.append((index[a] * size + index[middle],
+                           index[middle] * size + index[b]))
+    return result
 
 
-def digraph_counter_to_monomer_counter(digraphs: Counter[str]) -> Counter[str]:
-    double_counts: Counter[str] = Counter()
-    for d, count in digraphs.items():
-        double_counts[d[0]] += count
-        double_counts[d[1]] += count
-    monomers: Counter[str] = Counter()
-    for m, count in double_counts.items():
-        monomers[m] = (count + 1) // 2
-    return monomers
+def transition(elements: str, rules: Rules) -> List[List[int]]:
+    """The matrix taking the count of each pair to the counts after one step."""
+    pairs = successors(elements, rules)
+    matrix = [[0] * len(pairs) for _ in pairs]
+    for pair, new_pairs in enumerate(pairs):
+        for new_pair in new_pairs:
+            matrix[new_pair][pair] += 1
+    return matrix
 
 
-def part1(input_data: str) -> int:
+def step(pairs: List[int],
+         successors: List[Tuple[int, ...]],
+         modulus: Optional[int] = None) -> List[int]:
+    """The count of each pair after one step."""
+    new_pairs = [0] * len(pairs)
+    for pair, count in enumerate(pairs):
+        if count:
+            for new_pair in successors[pair]:
+                new_pairs[new_pair] += count
+    if modulus is not None:
+        new_pairs = [count % modulus for count in new_pairs]
+    return new_pairs
+
+
+@lru_cache(maxsize=4)
+def polymer(elements: str,
+            rules: Rules,
+            modulus: Optional[int] = None) -> MatrixPowers:
+    """
+    The powers of a set of rules' transition, shared by every count. Exact
+    powers for many steps are large, so polymer.cache_clear() frees them.
+    """
+    return MatrixPowers(transition(elements, rules), modulus)
+
+
+def element_counts(template: str,
+                   rules: Dict[str, str],
+                   steps: int,
+                   modulus: Optional[int] = None) -> Counter[str]:
+    """
+    The number of each element after some steps, optionally modulo some
+    number. Polymers double in length each step, so exact counts for many
+    more than 10^4 steps are too large to be practical.
+    """
+    elements = ''.join(sorted(set(template).union(*rules, *rules.values())))
+    index = {e: i for i, e in enumerate(elements)}
+    size = len(elements)
+    pairs = [0] * size**2
+    for a, b in itertools.pairwise(template):
+        pairs[index[a] * size + index[b]] += 1
+    compiled = tuple(sorted(rules.items()))
+    if steps <= DIRECT_STEPS:
+        pair_successors = successors(elements, compiled)
+        for _ in range(steps):
+            pairs = step(pairs, pair_successors, modulus)
+    else:
+        powers = polymer(elements, compiled, modulus)
+        pairs = [int(n) for n in powers.apply(steps, pairs)]
+    counts: Counter[str] = Counter()
+    for pair, count in enumerate(pairs):
+        counts[elements[pair // size]] += count
+    counts[template[-1]] += 1
+    return counts if modulus is None else Counter({
+        e: n % modulus
+        for e, n in counts.items()
+    })
+
+
+def spread(input_data: str, steps: int) -> int:
+    """The most common element's count less the least common one's."""
     template, rules = parse(input_data)
-    digraphs = Counter(''.join(pair) for pair in itertools.pairwise(template))
-    for _ in range(10):
-        digraphs = polymerise(digraphs, rules)
-    monomers = digraph_counter_to_monomer_counter(digraphs)
-    counts = monomers.most_common()
-    return counts[0][1] - counts[-1][1]
+    counts = [n for n in element_counts(template, rules, steps).values() if n]
+    return max(counts) - min(counts)
+
+
+def part1(input_data: str) -> int:
+    return spread(input_data, steps=10)
 
 
 def part2(input_data: str) -> int:
-    template, rules = parse(input_data)
-    digraphs = Counter(''.join(pair) for pair in itertools.pairwise(template))
-    for _ in range(40):
-        digraphs = polymerise(digraphs, rules)
-    monomers = digraph_counter_to_monomer_counter(digraphs)
-    counts = monomers.most_common()
-    return counts[0][1] - counts[-1][1]
+    return spread(input_data, steps=40)
 
 
 if __name__ == '__main__':
@@ -1,74 +1,26 @@
-from typing import Tuple, List
+from typing import List
 
-from aocd.models import Puzzle
-from networkx import DiGraph, grid_2d_graph
-from networkx.algorithms.shortest_paths.generic import shortest_path
+import numpy as np
 
+from aoc.grid import parse_digits
+from aoc.inputs import Puzzle
+"""
+Risk levels are 1 to 9, so the lowest total risk is found with a bucket
+queue: a ring of ten buckets holding the cells reached at each total risk
+from the current one to nine more. The buckets are worked through in order,
+and each holds arrays of cells so that a whole bucket is settled and
+expanded at once. Cells are pushed again when reached by a new route and
+skipped once settled, so no table of best totals is kept, only a flag per
+cell. The tiled map of part 2 is never built: each risk is worked out from
+the base map when needed.
+"""
 
-def parse(input_data: str) -> Tuple[int, int, DiGraph]:
-    lines = input_data.splitlines()
-    nrow = len(lines)
-    ncol = len(next(iter(lines)))
-    g: DiGraph = grid_2d_graph(nrow, ncol, create_using=DiGraph)
-    for row, line in enumerate(lines):
-        for col, digit in enumerate(line):
-            weight = int(digit)
-            this: Tuple[int, int] = (row, col)
-            that: Tuple[int, int]
-            g.nodes.get(this)['risk'] = weight
-            for that in g.neighbors(this):
-                g.add_edge(this, that, weight=weight)
-    return nrow, ncol, g
+MAX_RISK = 9
 
 
-def col_concat(b1: str, b2: str) -> str:
-    if not b1:
-        return b2
-    lines1 = b1.splitlines()
-    lines2 = b2.splitlines()
-    assert len(lines1) == len(lines2)
-    return '\n'.join(line1 + line2 for line1, line2 in zip(lines1, lines2))
-
-
-def row_concat(b1: str, b2: str) -> str:
-    if not b1:
-        return b2
-    return b1 + '\n' + b2
-
-
-def grow_input(input_data: str) -> str:
-    template = block_to_grid(input_data)
-    larger_block = ""
-    for row in range(5):
-        row_block = ""
-        for col in range(5):
-            new = block_to_str(calculate_block(template, row, col))
-            row_block = col_concat(row_block, new)
-        larger_block = row_concat(larger_block, row_block)
-    return larger_block
-
-
-def block_to_str(block: List[List[int]]) -> str:
-    lines: List[str] = []
-    for row in block:
-        line = ''.join(str(v) for v in row)
-        lines.append(line)
-    return '\n'.join(lines)
-
-
-def block_to_grid(block: str) -> List[List[int]]:
-    return [[int(v) for v in line] for line in block.splitlines()]
-
-
-def calculate_block(template: List[List[int]], row: int,
-                    col: int) -> List[List[int]]:
-    block_result = []
-    for r in template:
-        row_result = []
-        for v in r:
-            row_result.append(wrap(v + row + col))
-        block_result.append(row_result)
-    return block_result
+def parse(input_data: str) -> np.ndarray:
+    """The risk levels as a (rows x cols) array."""
+    return parse_digits(input_data)
 
 
 def wrap(risk: int):
@@ -77,18 +29,91 @@ def wrap(risk: int):
     return risk
 
 
+class RiskMap:
+    """A map of risk levels made of tiles x tiles copies of a base map."""
+
+    def __init__(self, base: np.ndarray, tiles: int = 1):
+        self.base = base.astype(np.int64)
+        self.tiles = tiles
+        self.shape = (base.shape[0] * tiles, base.shape[1] * tiles)
+
+    def __len__(self) -> int:
+        return self.shape[0] * self.shape[1]
+
+    def risk(self, cells: np.ndarray) -> np.ndarray:
+        """The risk levels of some cells, given as flat indices."""
+        rows, cols = np.divmod(cells, self.shape[1])
+        if self.tiles == 1:
+            return self.base[rows, cols]
+        base_rows, base_cols = self.base.shape
+        tile_rows, rows = np.divmod(rows, base_rows)
+        tile_cols, cols = np.divmod(cols, base_cols)
+        # Each tile to the right or below adds one, wrapping from 9 to 1.
+        return (self.base[rows, cols] + tile_rows + tile_cols - 1) % 9 + 1
+
+    def neighbours(self, cells: np.ndarray) -> np.ndarray:
+        """The cells up, down, left and right of each cell, where there are
+        any."""
+        width = self.shape[1]
+        rows, cols = np.divmod(cells, width)
+        return np.concatenate(
+            (cells[rows > 0] - width, cells[rows < self.shape[0] - 1] + width,
+             cells[cols > 0] - 1, cells[cols < width - 1] + 1))
+
+
+def unsettled(cells: np.ndarray, settled: np.ndarray) -> np.ndarray:
+    """One of each of the cells that are not yet settled, in order."""
+    cells = np.sort(cells[~settled[cells]])
+    first = np.ones(len(cells), dtype=bool)
+    first[1:] = cells[1:] != cells[:-1]
+    return cells[first]
+
+
+def lowest_total_risk(risks: RiskMap) -> int:
+    """
+    The lowest total risk of a path from the top left to the bottom right,
+    not counting the top left cell.
+    """
+    end = len(risks) - 1
+    settled = np.zeros(len(risks), dtype=bool)
+    buckets: List[List[np.ndarray]] = [[] for _ in range(MAX_RISK + 1)]
+    buckets[0].append(np.zeros(1, dtype=np.int64))
+    total = 0
+    while any(buckets):
+        bucket = buckets[total % len(buckets)]
+        if bucket:
+            cells = unsettled(np.concatenate(bucket), settled)
+            bucket.clear()
+            settled[cells] = True
+            if settled[end]:
+                return total
+            reached = risks.neighbours(cells)
+            reached = reached[~settled[reached]]
+            risk = risks.risk(reached)
+            for step in range(1, MAX_RISK + 1):
+                cells = reached[risk == step]
+                if len(cells):
+                    buckets[(total + step) % len(buckets)].append(cells)
+        total += 1
+    raise ValueError('The bottom right cell is unreachable.')
+
+
+def grow_input(input_data: str) -> str:
+    risks = RiskMap(parse(input_data), tiles=5)
+    rows, cols = risks.shape
+    # Each row ends in a column of newlines.
+    text = np.full((rows, cols + 1), ord('\n'), dtype=np.uint8)
+    text[:, :cols] = risks.risk(np.arange(len(risks))).reshape(rows, cols)
+    text[:, :cols] += ord('0')
+    return text.tobytes().decode('ascii')[:-1]
+
+
 def part1(input_data: str) -> int:
-    nrow, ncol, g = parse(input_data)
-    start = (0, 0)
-    end = (nrow - 1, ncol - 1)
-    it = shortest_path(g, start, end, weight='weight')
-    path = [g.nodes.get(n)['risk'] for n in it]
-    return sum(path[1:])
+    return lowest_total_risk(RiskMap(parse(input_data)))
 
 
 def part2(input_data: str) -> int:
-    input_data = grow_input(input_data)
-    return part1(input_data)
+    return lowest_total_risk(RiskMap(parse(input_data), tiles=5))
 
 
 if __name__ == '__main__':
@@ -1,10 +1,132 @@
 from dataclasses import dataclass, field
-from io import StringIO
-from typing import Optional, List, Tuple
+from typing import Iterator, Optional, List, Tuple
 
-from aocd.models import Puzzle
 from math import prod
 
+from aoc.inputs import Puzzle
+"""
+The transmission is read from bytes by a cursor, and each field is pulled out
+of the few bytes it spans with a shift and a mask, so reading it never copies
+the rest of it. Packets are parsed without recursion: the operators still
+waiting for sub-packets are kept on a stack, each with the bit position or
+number of sub-packets that closes it. Both parts are answered from the
+parser's stream of packets without building a tree, by folding each
+operator's sub-packets into its result as they are read.
+"""
+
+LITERAL = 4
+
+
+class BitReader:
+    """A cursor over the bits of some bytes, most significant bit first."""
+
+    def __init__(self, data: bytes, length: Optional[int] = None):
+        self.data = data
+        self.length = len(data) * 8 if length is None else length
+        """The number of bits that may be read."""
+        self.pos = 0
+
+    @staticmethod
+    def from_hex(hex_data: str) -> 'BitReader':
+        hex_data = hex_data.strip()
+        return BitReader(bytes.fromhex(hex_data + '0' * (len(hex_data) % 2)),
+                         len(hex_data) * 4)
+
+    @staticmethod
+    def from_bits(bits: str) -> 'BitReader':
+        padded = bits + '0' * (-len(bits) % 8)
+        return BitReader(
+            int(padded or '0', 2).to_bytes(len(padded) // 8, 'big'), len(bits))
+
+    def read(self, n: int) -> int:
+        """The next n bits as an unsigned int."""
+        end = self.pos + n
+        if end > self.length:
+            raise ValueError('The transmission ends mid-packet.')
+        chunk = int.from_bytes(self.data[self.pos >> 3:(end + 7) >> 3], 'big')
+        self.pos = end
+        return chunk >> (-end % 8) & ((1 << n) - 1)
+
+    def read_literal(self) -> int:
+        value = 0
+        more = True
+        while more:
+            group = self.read(5)
+            more = bool(group >> 4)
+            value = value << 4 | group & 0xF
+        return value
+
+    def remainder(self) -> str:
+        """The bits not yet read, as a string of 0s and 1s."""
+        n = self.length - self.pos
+        return f'{self.read(n):0{n}b}' if n else ''
+
+
+@dataclass
+class OpenOperator:
+    """An operator packet still waiting for some of its sub-packets."""
+    end: Optional[int] = None
+    """The bit position its sub-packets end at, for a length in bits."""
+    left: Optional[int] = None
+    """The number of sub-packets still to come, for a length in packets."""
+
+    def is_closed(self, pos: int) -> bool:
+        if self.end is None:
+            return self.left == 0
+        if pos > self.end:
+            raise ValueError('A sub-packet overruns its operator.')
+        return pos == self.end
+
+
+Header = Tuple[int, int, Optional[int]]
+"""A packet's version, type id and, for a literal, value."""
+
+
+def scan(reader: BitReader) -> Iterator[Optional[Header]]:
+    """
+    The packets of one outermost packet in order, each before its
+    sub-packets, with None after the last sub-packet of each operator. This
+    leaves the reader just after the packet.
+    """
+    stack: List[OpenOperator] = []
+    while True:
+        version = reader.read(3)
+        type_id = reader.read(3)
+        if stack and stack[-1].left is not None:
+            stack[-1].left -= 1
+        if type_id == LITERAL:
+            yield version, type_id, reader.read_literal()
+        else:
+            yield version, type_id, None
+            if reader.read(1) == 0:
+                length = reader.read(15)
+                stack.append(OpenOperator(end=reader.pos + length))
+            else:
+                stack.append(OpenOperator(left=reader.read(11)))
+        while stack and stack[-1].is_closed(reader.pos):
+            stack.pop()
+            yield None
+        if not stack:
+            return
+
+
+def operate(type_id: int, operands: List[int]) -> int:
+    if type_id == 0:
+        return sum(operands)
+    if type_id == 1:
+        return prod(operands)
+    if type_id == 2:
+        return min(operands)
+    if type_id == 3:
+        return max(operands)
+    if type_id == 5:
+        return int(operands[0] > operands[1])
+    if type_id == 6:
+        return int(operands[0] < operands[1])
+    if type_id == 7:
+        return int(operands[0] == operands[1])
+    raise ValueError(f'Unsupported type id {type_id}')
+
 
 @dataclass
 class Packet:
@@ -13,103 +135,104 @@ class Packet:
     value: Optional[int]
     children: List['Packet'] = field(default_factory=list)
 
+    def walk(self) -> Iterator['Packet']:
+        """This packet and all those inside it, each before its children."""
+        stack = [self]
+        while stack:
+            packet = stack.pop()
+            yield packet
+            stack.extend(reversed(packet.children))
+
     def version_sum(self) -> int:
-        version = self.version
-        for child in self.children:
-            version += child.version_sum()
-        return version
+        return sum(packet.version for packet in self.walk())
 
     def evaluate(self) -> int:
-        if self.type_id == 0:
-            return sum(child.evaluate() for child in self.children)
-        if self.type_id == 1:
-            return prod(child.evaluate() for child in self.children)
-        if self.type_id == 2:
-            return min(child.evaluate() for child in self.children)
-        if self.type_id == 3:
-            return max(child.evaluate() for child in self.children)
-        if self.type_id == 4:
-            assert self.value is not None
-            return self.value
-        if self.type_id == 5:
-            return int(
-                self.children[0].evaluate() > self.children[1].evaluate())
-        if self.type_id == 6:
-            return int(
-                self.children[0].evaluate() < self.children[1].evaluate())
-        if self.type_id == 7:
-            return int(
-                self.children[0].evaluate() == self.children[1].evaluate())
-        raise ValueError(f'Unsupported type id {self.type_id}')
+        # Children come after their parents in a walk, so going through it
+        # backwards evaluates each packet's children before the packet.
+        values = {}
+        for packet in reversed(list(self.walk())):
+            if packet.type_id == LITERAL:
+                assert packet.value is not None
+                values[id(packet)] = packet.value
+            else:
+                values[id(packet)] = operate(
+                    packet.type_id,
+                    [values.pop(id(child)) for child in packet.children])
+        return values[id(self)]
+
+    @staticmethod
+    def read(reader: BitReader) -> 'Packet':
+        """Read one outermost packet, leaving the reader just after it."""
+        stack: List[Packet] = []
+        for header in scan(reader):
+            if header is None:
+                packet = stack.pop()
+                continue
+            packet = Packet(*header)
+            if stack:
+                stack[-1].children.append(packet)
+            if packet.type_id != LITERAL:
+                stack.append(packet)
+        return packet
 
     @staticmethod
     def parse(bits: str) -> Tuple['Packet', str]:
-        b = StringIO(bits)
-        version = int(b.read(3), 2)
-        type_id = int(b.read(3), 2)
-        if type_id == 4:
-            has_next = True
-            nybbles = []
-            while has_next:
-                has_next = bool(int(b.read(1)))
-                nybbles.append(b.read(4))
-            return Packet(version, type_id, int(''.join(nybbles), 2)), b.read()
+        reader = BitReader.from_bits(bits)
+        return Packet.read(reader), reader.remainder()
+
+
+@dataclass
+class Fold:
+    """An operator's result so far, from the sub-packets read so far."""
+    type_id: int
+    value: Optional[int] = None
+    operands: int = 0
+
+    def add(self, operand: int) -> None:
+        if self.value is None:
+            self.value = operand
         else:
-            children: List[Packet]
-            length_type_id = int(b.read(1))
-            if length_type_id == 0:
-                number_of_bits = int(b.read(15), 2)
-                children, remaining_bits = Packet.parse_many(
-                    b.read(number_of_bits))
-            else:
-                number_of_packets = int(b.read(11), 2)
-                children, remaining_bits = Packet.parse_many(
-                    b.read(), packet_limit=number_of_packets)
-                b = StringIO(remaining_bits)
-            return Packet(version, type_id, None, children), b.read()
+            self.value = operate(self.type_id, [self.value, operand])
+        self.operands += 1
 
-    @staticmethod
-    def parse_many(bits: str, packet_limit=-1) -> Tuple[List['Packet'], str]:
-        packets: List[Packet] = []
-        while bits and packet_limit:
-            p, bits = Packet.parse(bits)
-            packets.append(p)
-            packet_limit -= 1
-        return packets, bits
-
-
-def hex_to_bin(input_data: str):
-    table = {
-        '0': '0000',
-        '1': '0001',
-        '2': '0010',
-        '3': '0011',
-        '4': '0100',
-        '5': '0101',
-        '6': '0110',
-        '7': '0111',
-        '8': '1000',
-        '9': '1001',
-        'A': '1010',
-        'B': '1011',
-        'C': '1100',
-        'D': '1101',
-        'E': '1110',
-        'F': '1111',
-    }
-    return ''.join(table[c] for c in input_data)
+    def result(self) -> int:
+        if self.type_id in (5, 6, 7) and self.operands != 2:
+            raise ValueError('A comparison needs exactly two sub-packets.')
+        if self.value is None:
+            return operate(self.type_id, [])
+        return self.value
+
+
+def stream(reader: BitReader) -> Tuple[int, int]:
+    """
+    The version sum and value of one outermost packet, without building its
+    tree. Each operator's result is folded in as its sub-packets close, so
+    only the operators enclosing the current packet are held.
+    """
+    version_sum = 0
+    stack: List[Fold] = []
+    value = 0
+    for header in scan(reader):
+        if header is None:
+            value = stack.pop().result()
+        else:
+            version, type_id, literal = header
+            version_sum += version
+            if literal is None:
+                stack.append(Fold(type_id))
+                continue
+            value = literal
+        if stack:
+            stack[-1].add(value)
+    return version_sum, value
 
 
 def part1(input_data: str) -> int:
-    bits = hex_to_bin(input_data)
-    root, _ = Packet.parse(bits)
-    return root.version_sum()
+    return stream(BitReader.from_hex(input_data))[0]
 
 
 def part2(input_data: str) -> int:
-    bits = hex_to_bin(input_data)
-    root, _ = Packet.parse(bits)
-    return root.evaluate()
+    return stream(BitReader.from_hex(input_data))[1]
 
 
 if __name__ == '__main__':
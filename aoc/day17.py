@@ -1,18 +1,34 @@
 import re
 from typing import Tuple
 
-from aocd.models import Puzzle
+import numpy as np
+
+from aoc.inputs import Puzzle
+"""
+Along either axis the probe's velocity drops by one each step, so after t
+steps at a starting velocity v it has moved t * v - t * (t - 1) / 2, a
+downward parabola in t. The steps at which it is at least some distance
+along are then a single run, found from the parabola's roots. For each
+starting dy the steps inside the target's y range are one run, and so are
+those inside its x range for each dx, running on forever if the probe stalls
+inside it. A launch hits if its two runs overlap, and the runs for every dx
+are sorted once so that every dy counts its overlaps by binary search.
+"""
+
+STALLED = np.iinfo(np.int64).max
+"""The last step in the x range of a probe that stops inside it."""
 
 
 def hits_target(dx, dy, current_position: Tuple[int, int],
                 target: Tuple[int, int, int, int]) -> bool:
     x, y = current_position
     x_min, x_max, y_min, y_max = target
-    if x_min <= x <= x_max and y_min <= y <= y_max:
-        return True
-    if x > x_max or y < y_min:
-        return False
-    return hits_target(max(0, dx - 1), (dy - 1), (x + dx, y + dy), target)
+    while not (x_min <= x <= x_max and y_min <= y <= y_max):
+        if x > x_max or y < y_min:
+            return False
+        x, y = x + dx, y + dy
+        dx, dy = max(0, dx - 1), dy - 1
+    return True
 
 
 def parse(input_data: str) -> Tuple[int, int, int, int]:
@@ -20,19 +36,101 @@ def parse(input_data: str) -> Tuple[int, int, int, int]:
     return x_min, x_max, y_min, y_max
 
 
+def distance(velocity: np.ndarray, steps: np.ndarray) -> np.ndarray:
+    """How far the probe moves in some steps, if it never stops."""
+    return steps * velocity - steps * (steps - 1) // 2
+
+
+def reaching(velocity: np.ndarray,
+             least: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    The first and last steps at which the probe has moved at least some
+    distance, for each starting velocity. The first is after the last if it
+    never does.
+    """
+    b = 2 * velocity + 1
+    discriminant = b * b - 8 * least
+    reached = discriminant >= 0
+    # The parabola's roots are (b +- sqrt(discriminant)) / 2. The rounded
+    # square root is at most one out, so these are at most a step out.
+    root = np.sqrt(np.maximum(discriminant, 0)).astype(np.int64)
+    first = np.maximum(0, (b - root) // 2)
+    last = (b + root) // 2
+    first -= (first > 0) & (distance(velocity, first - 1) >= least)
+    first += distance(velocity, first) < least
+    further = distance(velocity, last + 1) >= least
+    last += further
+    last -= ~further & (distance(velocity, last) < least)
+    misses = ~reached | (distance(velocity, first) < least)
+    last[misses] = -1
+    return first, np.maximum(last, first - 1)
+
+
+def x_steps(dx: np.ndarray, x_min: int,
+            x_max: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    The first and last steps inside the x range for each dx, with a last
+    step of STALLED for probes that stop inside it, and a first step after
+    the last for probes that miss it.
+    """
+    first, last = reaching(dx, x_min)
+    # The probe stops after dx steps, so only reaching by then counts.
+    misses = (first > last) | (first > dx)
+    past, never_past = reaching(dx, x_max + 1)
+    stalls = (past > never_past) | (past > dx)
+    last = np.where(stalls, STALLED, past - 1)
+    last[misses] = -1
+    return first, np.maximum(last, first - 1)
+
+
+def y_steps(dy: np.ndarray, y_min: int,
+            y_max: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    The first and last steps inside a y range below the launcher for each
+    dy, with the first after the last for probes that miss it.
+    """
+    # Both runs start at step 0, where the probe is above the target.
+    _, above_top = reaching(dy, y_max + 1)
+    _, above_bottom = reaching(dy, y_min)
+    return above_top + 1, above_bottom
+
+
+def hits_by_dy(
+        target: Tuple[int, int, int, int]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    The starting dy of the launches that hit the target, and for each, the
+    number of starting dx that do.
+    """
+    x_min, x_max, y_min, y_max = target
+    if x_min <= 0 or y_max >= 0:
+        raise ValueError('The target must be below and to the right of the '
+                         'launcher.')
+    x_first, x_last = x_steps(np.arange(1, x_max + 1), x_min, x_max)
+    hit = x_first <= x_last
+    firsts = np.sort(x_first[hit])
+    lasts = np.sort(x_last[hit])
+    # A faster drop passes the target in one step, and a faster climb
+    # comes back down past it in one step.
+    dy = np.arange(y_min, -y_min)
+    y_first, y_last = y_steps(dy, y_min, y_max)
+    hit = y_first <= y_last
+    dy, y_first, y_last = dy[hit], y_first[hit], y_last[hit]
+    # Runs in x that start by the end of each run in y, less those that
+    # end before it starts.
+    counts = (np.searchsorted(firsts, y_last, side='right') -
+              np.searchsorted(lasts, y_first, side='left'))
+    return dy[counts > 0], counts[counts > 0]
+
+
 def part1(input_data: str) -> int:
-    _, _, y_min, _ = parse(input_data)
-    return abs(y_min) * abs(y_min + 1) // 2
+    dy, _ = hits_by_dy(parse(input_data))
+    top = int(dy.max())
+    return top * (top + 1) // 2 if top > 0 else 0
 
 
 def part2(input_data: str) -> int:
-    x_min, x_max, y_min, y_max = parse(input_data)
-    count = 0
-    for dx in range(1, x_max + 1):
-        for dy in range(y_min, abs(y_min)):
-            if hits_target(dx, dy, (0, 0), (x_min, x_max, y_min, y_max)):
-                count += 1
-    return count
+    _, counts = hits_by_dy(parse(input_data))
+    return int(counts.sum())
 
 
 if __name__ == '__main__':
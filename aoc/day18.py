@@ -1,10 +1,25 @@
 import functools
-import itertools
-from dataclasses import dataclass
-from typing import List, Optional, Union
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence, Tuple, Union
 
 import math
-from aocd.models import Puzzle
+
+from aoc.inputs import Puzzle
+"""
+Besides the tree of pairs, a snailfish number can be kept as its regular
+numbers from left to right, each with its depth: the number of pairs it is
+inside. A pair's two numbers are then neighbours at the same depth, and the
+numbers either side of them are the ones it explodes into, so every action
+is a change to a few neighbouring entries.
+"""
+
+EXPLODE_DEPTH = 5
+"""The depth of the numbers in a pair nested inside four pairs."""
+
+PARALLEL_THRESHOLD = 500
+"""The fewest numbers for which part 2 is worth a process pool."""
 
 
 @dataclass
@@ -140,24 +155,180 @@ class SnailFishPair:
             raise ValueError('child does not currently exist.')
 
 
-def parse(input_data: str) -> list[SnailFishPair]:
-    lines = input_data.splitlines()
-    numbers: List[SnailFishPair] = []
-    for line in lines:
-        n = SnailFishPair.from_list(eval(line))
-        numbers.append(n)
-    return numbers
+@dataclass
+class SnailFishNumber:
+    values: List[int] = field(default_factory=list)
+    """The regular numbers from left to right."""
+    depths: List[int] = field(default_factory=list)
+    """The number of pairs each regular number is inside."""
+
+    @staticmethod
+    def parse(text: str) -> 'SnailFishNumber':
+        number = SnailFishNumber()
+        depth = 0
+        digits = ''
+        for c in text:
+            if c.isdigit():
+                digits += c
+                continue
+            if digits:
+                number.values.append(int(digits))
+                number.depths.append(depth)
+                digits = ''
+            if c == '[':
+                depth += 1
+            elif c == ']':
+                depth -= 1
+                if depth < 0:
+                    raise ValueError(f'Unbalanced brackets in {text!r}')
+            elif c not in ', ':
+                raise ValueError(f'Unexpected {c!r} in {text!r}')
+        if depth or digits or not number.values:
+            raise ValueError(f'Malformed snailfish number {text!r}')
+        return number
+
+    @staticmethod
+    def add(a: 'SnailFishNumber', b: 'SnailFishNumber') -> 'SnailFishNumber':
+        root = SnailFishNumber(a.values + b.values,
+                               [d + 1 for d in a.depths + b.depths])
+        root.reduce()
+        return root
+
+    def explode(self, i: int) -> None:
+        """Explode the pair whose left number is at i."""
+        values = self.values
+        left, right = values[i], values[i + 1]
+        if i > 0:
+            values[i - 1] += left
+        if i + 2 < len(values):
+            values[i + 2] += right
+        values[i:i + 2] = [0]
+        self.depths[i:i + 2] = [self.depths[i] - 1]
+
+    def reduce(self) -> None:
+        """
+        Reduce a number with no pairs nested deeper than the ones that
+        explode, as the sum of two reduced numbers is.
+        """
+        values, depths = self.values, self.depths
+        if max(depths) > EXPLODE_DEPTH:
+            raise ValueError('Pairs are nested too deeply to reduce.')
+        # Exploding never nests a pair any deeper, so every pair that
+        # explodes is there at the start, and they go from left to right.
+        i = 0
+        while i < len(values):
+            if depths[i] == EXPLODE_DEPTH:
+                self.explode(i)
+            i += 1
+        # Then every number left of i is under 10. A number that splits
+        # into an exploding pair explodes at once, which may take the number
+        # to its left to 10 or more.
+        i = 0
+        while i < len(values):
+            value = values[i]
+            if value < 10:
+                i += 1
+                continue
+            depth = depths[i] + 1
+            values[i:i + 1] = [value // 2, value - value // 2]
+            depths[i:i + 1] = [depth, depth]
+            if depth == EXPLODE_DEPTH:
+                self.explode(i)
+                i = max(0, i - 1)
+
+    def pack(self) -> bytes:
+        """The values then the depths, a byte each."""
+        return bytes(self.values + self.depths)
+
+    @staticmethod
+    def unpack(data: bytes) -> 'SnailFishNumber':
+        n = len(data) // 2
+        return SnailFishNumber(list(data[:n]), list(data[n:]))
+
+    def magnitude(self) -> int:
+        # A stack of (magnitude, depth), where a pair's two halves meet as
+        # neighbours at the same depth.
+        stack: List[Tuple[int, int]] = []
+        for value, depth in zip(self.values, self.depths):
+            while stack and stack[-1][1] == depth:
+                left, _ = stack.pop()
+                value, depth = 3 * left + 2 * value, depth - 1
+            stack.append((value, depth))
+        assert len(stack) == 1 and stack[0][1] == 0, 'not a single number.'
+        return stack[0][0]
+
+    def marshal(self) -> List[int | List]:
+        stack: List[Tuple[int | List, int]] = []
+        for value, depth in zip(self.values, self.depths):
+            item: int | List = value
+            while stack and stack[-1][1] == depth:
+                left, _ = stack.pop()
+                item, depth = [left, item], depth - 1
+            stack.append((item, depth))
+        assert len(stack) == 1 and stack[0][1] == 0, 'not a single number.'
+        result = stack[0][0]
+        assert isinstance(result, list)
+        return result
+
+
+def parse(input_data: str) -> List[SnailFishNumber]:
+    return [SnailFishNumber.parse(line) for line in input_data.splitlines()]
+
+
+def largest_in_rows(numbers: Sequence[SnailFishNumber], rows: range) -> int:
+    """
+    The largest magnitude of a sum of two different numbers, the first of
+    them from some rows of numbers.
+    """
+    return max(
+        SnailFishNumber.add(numbers[i], numbers[j]).magnitude() for i in rows
+        for j in range(len(numbers)) if i != j)
+
+
+_pool_numbers: List[SnailFishNumber] = []
+"""Each pool worker's copy of the numbers, unpacked once."""
+
+
+def _load_numbers(packed: List[bytes]) -> None:
+    _pool_numbers[:] = [SnailFishNumber.unpack(data) for data in packed]
+
+
+def _largest_in_pool_rows(rows: range) -> int:
+    return largest_in_rows(_pool_numbers, rows)
+
+
+def largest_magnitude(numbers: Sequence[SnailFishNumber],
+                      jobs: int = 1) -> int:
+    """
+    The largest magnitude of a sum of two different numbers. With jobs other
+    than 1 the sums are shared out between that many processes (0 for one
+    per CPU, which on a single CPU means none). Each worker is sent the
+    packed numbers once, then batches of rows of sums, each a few times
+    fewer than the rows per worker so that the workers finish together.
+    """
+    workers = jobs or os.cpu_count() or 1
+    if workers == 1:
+        return largest_in_rows(numbers, range(len(numbers)))
+    size = max(1, -(-len(numbers) // (4 * workers)))
+    batches = [
+        range(start, min(start + size, len(numbers)))
+        for start in range(0, len(numbers), size)
+    ]
+    with ProcessPoolExecutor(max_workers=workers,
+                             initializer=_load_numbers,
+                             initargs=([n.pack() for n in numbers], )) as pool:
+        return max(pool.map(_largest_in_pool_rows, batches))
 
 
 def part1(input_data: str) -> int:
-    numbers: List[SnailFishPair] = parse(input_data)
-    return functools.reduce(SnailFishPair.add, numbers).magnitude()
+    numbers = parse(input_data)
+    return functools.reduce(SnailFishNumber.add, numbers).magnitude()
 
 
 def part2(input_data: str) -> int:
-    numbers: List[SnailFishPair] = parse(input_data)
-    pairs = itertools.permutations(numbers, 2)
-    return max(SnailFishPair.add(*pair).magnitude() for pair in pairs)
+    numbers = parse(input_data)
+    jobs = 0 if len(numbers) >= PARALLEL_THRESHOLD else 1
+    return largest_magnitude(numbers, jobs)
 
 
 if __name__ == '__main__':
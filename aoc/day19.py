@@ -3,7 +3,7 @@ from collections import deque
 from dataclasses import dataclass
 from typing import Optional
 
-from aocd.models import Puzzle
+from aoc.inputs import Puzzle
 """
 The relative position of beacons within a scanner range is known. We can model these as vectors.
 We can then compare the vectors between scanners independent of the coordinate system.
@@ -2,7 +2,7 @@ import itertools
 from dataclasses import dataclass
 from typing import Generator, Any
 
-from aocd.models import Puzzle
+from aoc.inputs import Puzzle
 
 
 @dataclass(frozen=True)
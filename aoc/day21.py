@@ -3,7 +3,7 @@ import re
 from dataclasses import dataclass
 from functools import lru_cache
 
-from aocd.models import Puzzle
+from aoc.inputs import Puzzle
 
 board_score = [10, 1, 2, 3, 4, 5, 6, 7, 8, 9]
 dirac_winning_threshold = 21
@@ -3,7 +3,7 @@ from collections import Counter
 from dataclasses import dataclass
 from typing import Optional
 
-from aocd.models import Puzzle
+from aoc.inputs import Puzzle
 
 
 @dataclass(frozen=True)
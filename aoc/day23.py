@@ -2,7 +2,7 @@ import re
 from dataclasses import dataclass
 from typing import Optional
 
-from aocd.models import Puzzle
+from aoc.inputs import Puzzle
 
 """
 A amphipods are assigned a value of 0, energy = 1 * 10^0
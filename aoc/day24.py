@@ -5,7 +5,7 @@ from io import StringIO
 from multiprocessing import Queue, Process
 from random import random
 
-from aocd.models import Puzzle
+from aoc.inputs import Puzzle
 
 
 @dataclass
@@ -1,4 +1,4 @@
-from aocd.models import Puzzle
+from aoc.inputs import Puzzle
 
 
 def part1(input_data: str) -> int:
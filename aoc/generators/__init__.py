@@ -0,0 +1,12 @@
+"""
+Seeded generators of valid puzzle inputs at arbitrary scale.
+
+aoc.generators.dayNN.generate() returns an input for aoc.dayNN. Every
+generator takes a seed, and the same arguments always give the same input.
+"""
+import importlib
+
+
+def generate(day: int, seed: int = 0, **params) -> str:
+    module = importlib.import_module(f'{__name__}.day{day:02d}')
+    return module.generate(seed=seed, **params)
@@ -0,0 +1,12 @@
+import random
+
+
+def generate(n: int = 2000, seed: int = 0) -> str:
+    """n sonar depth readings, drifting deeper on average."""
+    rng = random.Random(seed)
+    depth = rng.randint(100, 200)
+    readings: list[str] = []
+    for _ in range(n):
+        depth = max(0, depth + rng.randint(-20, 25))
+        readings.append(str(depth))
+    return '\n'.join(readings)
@@ -0,0 +1,22 @@
+import random
+
+
+def generate(n: int = 1000, seed: int = 0) -> str:
+    """n course commands. The submarine never rises above the surface."""
+    rng = random.Random(seed)
+    depth = 0
+    commands: list[str] = []
+    for _ in range(n):
+        command = rng.choice(('forward', 'down', 'up'))
+        magnitude = rng.randint(1, 9)
+        if command == 'up':
+            if depth == 0:
+                command = 'down'
+            else:
+                magnitude = min(magnitude, depth)
+        if command == 'down':
+            depth += magnitude
+        elif command == 'up':
+            depth -= magnitude
+        commands.append(f'{command} {magnitude}')
+    return '\n'.join(commands)
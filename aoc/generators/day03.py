@@ -0,0 +1,33 @@
+import random
+
+
+def generate(n: int = 1000, width: int = 12, seed: int = 0) -> str:
+    """
+    n distinct diagnostic numbers of width bits, with bits adjusted so that
+    the CO2 scrubber rating is always defined: filtering by the least common
+    bit must never leave an empty sample, which happens whenever two or more
+    numbers remain that agree on the next bit.
+    """
+    assert n <= 2**width, f'cannot draw {n} distinct {width}-bit numbers.'
+    rng = random.Random(seed)
+    if 2 * n >= 2**width:
+        numbers = rng.sample(range(2**width), n)
+    else:
+        distinct: dict[int, None] = {}
+        while len(distinct) < n:
+            distinct[rng.getrandbits(width)] = None
+        numbers = list(distinct)
+
+    sample: list[int] = list(range(n))
+    for bit in reversed(range(width)):
+        if len(sample) == 1:
+            break
+        ones = [i for i in sample if numbers[i] >> bit & 1]
+        if len(ones) in (0, len(sample)):
+            # Flipping the bit of one number can't make it a duplicate, as
+            # any equal number would share its higher bits and be here too.
+            numbers[rng.choice(sample)] ^= 1 << bit
+            ones = [i for i in sample if numbers[i] >> bit & 1]
+        zeros = [i for i in sample if not numbers[i] >> bit & 1]
+        sample = zeros if len(ones) >= len(zeros) else ones
+    return '\n'.join(f'{number:0{width}b}' for number in numbers)
@@ -0,0 +1,20 @@
+import random
+
+
+def generate(n_boards: int = 100, side: int = 5, seed: int = 0) -> str:
+    """
+    n_boards distinct side x side boards. Every number that appears on a
+    board is eventually called, so every board wins.
+    """
+    rng = random.Random(seed)
+    numbers = range(max(100, side * side))
+    calls = list(numbers)
+    rng.shuffle(calls)
+    width = len(str(numbers[-1]))
+    boards: list[str] = []
+    for _ in range(n_boards):
+        cells = rng.sample(numbers, side * side)
+        rows = (cells[i:i + side] for i in range(0, side * side, side))
+        boards.append('\n'.join(' '.join(f'{n:{width}d}' for n in row)
+                                for row in rows))
+    return ','.join(map(str, calls)) + '\n\n' + '\n\n'.join(boards)
@@ -0,0 +1,27 @@
+import random
+
+
+def generate(n: int = 500,
+             size: int = 1000,
+             diagonal_fraction: float = 0.3,
+             seed: int = 0) -> str:
+    """
+    n horizontal, vertical or 45 degree vent lines with coordinates in
+    [0, size).
+    """
+    rng = random.Random(seed)
+    lines: list[str] = []
+    for _ in range(n):
+        x1, y1 = rng.randrange(size), rng.randrange(size)
+        if rng.random() < diagonal_fraction:
+            dx, dy = rng.choice((1, -1)), rng.choice((1, -1))
+            limit_x = size - 1 - x1 if dx > 0 else x1
+            limit_y = size - 1 - y1 if dy > 0 else y1
+            length = rng.randint(0, min(limit_x, limit_y))
+            x2, y2 = x1 + dx * length, y1 + dy * length
+        elif rng.random() < 0.5:
+            x2, y2 = rng.randrange(size), y1
+        else:
+            x2, y2 = x1, rng.randrange(size)
+        lines.append(f'{x1},{y1} -> {x2},{y2}')
+    return '\n'.join(lines)
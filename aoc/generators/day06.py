@@ -0,0 +1,7 @@
+import random
+
+
+def generate(n: int = 300, seed: int = 0) -> str:
+    """The internal timers of n lanternfish."""
+    rng = random.Random(seed)
+    return ','.join(str(rng.randint(1, 5)) for _ in range(n))
@@ -0,0 +1,9 @@
+import random
+
+
+def generate(n: int = 1000, max_position: int = 2000, seed: int = 0) -> str:
+    """The horizontal positions of n crabs, clustered towards zero."""
+    rng = random.Random(seed)
+    return ','.join(
+        str(min(max_position, int(rng.expovariate(4 / max_position))))
+        for _ in range(n))
@@ -0,0 +1,25 @@
+import random
+
+DIGITS = ('abcefg', 'cf', 'acdeg', 'acdfg', 'bcdf', 'abdfg', 'abdefg', 'acf',
+          'abcdefg', 'abcdfg')
+
+
+def generate(n: int = 200, seed: int = 0) -> str:
+    """n notes, each from a display with its own scrambled wiring."""
+    rng = random.Random(seed)
+    entries: list[str] = []
+    for _ in range(n):
+        wires = list('abcdefg')
+        rng.shuffle(wires)
+        wiring = str.maketrans('abcdefg', ''.join(wires))
+
+        def scramble(segments: str) -> str:
+            letters = list(segments.translate(wiring))
+            rng.shuffle(letters)
+            return ''.join(letters)
+
+        patterns = [scramble(d) for d in DIGITS]
+        rng.shuffle(patterns)
+        outputs = [scramble(rng.choice(DIGITS)) for _ in range(4)]
+        entries.append(' '.join(patterns) + ' | ' + ' '.join(outputs))
+    return '\n'.join(entries)
@@ -0,0 +1,8 @@
+import random
+
+
+def generate(rows: int = 100, cols: int = 100, seed: int = 0) -> str:
+    """A rows x cols heightmap."""
+    rng = random.Random(seed)
+    return '\n'.join(''.join(rng.choices('0123456789', k=cols))
+                     for _ in range(rows))
@@ -0,0 +1,42 @@
+import random
+
+PAIRS = {'(': ')', '[': ']', '{': '}', '<': '>'}
+
+
+def generate(n: int = 100,
+             length: int = 100,
+             corrupt_fraction: float = 0.5,
+             seed: int = 0) -> str:
+    """
+    n lines of navigation subsystem about length characters long. Lines are
+    either corrupt or incomplete, and there is always an odd number of
+    incomplete lines so that their scores have a middle.
+    """
+    rng = random.Random(seed)
+    corrupt = [rng.random() < corrupt_fraction for _ in range(n)]
+    n_incomplete = corrupt.count(False)
+    if n_incomplete % 2 == 0:
+        # Flip one line to make the number of incomplete lines odd.
+        i = rng.randrange(n)
+        corrupt[i] = not corrupt[i]
+    lines: list[str] = []
+    for is_corrupt in corrupt:
+        stack: list[str] = []
+        symbols: list[str] = []
+        while len(symbols) < length or not stack:
+            if stack and rng.random() < 0.45:
+                symbols.append(stack.pop())
+            else:
+                opening = rng.choice(tuple(PAIRS))
+                symbols.append(opening)
+                stack.append(PAIRS[opening])
+        if is_corrupt:
+            # Replace a closing symbol with one that doesn't match.
+            expected = stack[-1]
+            symbols.append(
+                rng.choice([c for c in PAIRS.values() if c != expected]))
+            for _ in range(rng.randint(0, length // 10)):
+                symbols.append(
+                    rng.choice(tuple(PAIRS) + tuple(PAIRS.values())))
+        lines.append(''.join(symbols))
+    return '\n'.join(lines)
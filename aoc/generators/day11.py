@@ -0,0 +1,11 @@
+import random
+
+
+def generate(rows: int = 10, cols: int = 10, seed: int = 0) -> str:
+    """
+    The energy levels of a rows x cols grid of octopuses. Unlike the real
+    puzzle inputs, a random grid is not guaranteed to ever flash in sync.
+    """
+    rng = random.Random(seed)
+    return '\n'.join(''.join(rng.choices('0123456789', k=cols))
+                     for _ in range(rows))
@@ -0,0 +1,39 @@
+import itertools
+import random
+import string
+
+
+def cave_names(letters: str, n: int) -> list[str]:
+    names = (''.join(p) for length in itertools.count(2)
+             for p in itertools.product(letters, repeat=length))
+    return list(itertools.islice(names, n))
+
+
+def generate(n_small: int = 6,
+             n_large: int = 2,
+             n_edges: int = 10,
+             seed: int = 0) -> str:
+    """
+    A cave system with n_small small caves and n_large large caves,
+    connected by about n_edges passages besides those to start and end.
+    Large caves are never connected to each other, as that would allow
+    infinitely many paths.
+    """
+    rng = random.Random(seed)
+    small = cave_names(string.ascii_lowercase, n_small)
+    large = cave_names(string.ascii_uppercase, n_large)
+    caves = small + large
+    edges: set[tuple[str, str]] = set()
+    for cave in rng.sample(caves, min(len(caves), 2)):
+        edges.add(('start', cave))
+    for cave in rng.sample(caves, min(len(caves), 2)):
+        edges.add((cave, 'end'))
+    # Every large cave connects to at least one small cave.
+    for cave in large:
+        if small:
+            edges.add((cave, rng.choice(small)))
+    candidates = [(a, b) for a, b in itertools.combinations(caves, 2)
+                  if not (a in large and b in large)]
+    rng.shuffle(candidates)
+    edges.update(candidates[:n_edges])
+    return '\n'.join(f'{a}-{b}' for a, b in sorted(edges))
@@ -0,0 +1,37 @@
+import random
+
+
+def generate(width: int = 40,
+             height: int = 6,
+             n_folds: int = 12,
+             density: float = 0.3,
+             seed: int = 0) -> str:
+    """
+    Dots on transparent paper that, after n_folds folds, show a width x
+    height pattern. Folds alternate between axes and always fold the paper
+    exactly in half, so no dot ever lies on a fold line.
+    """
+    rng = random.Random(seed)
+    dots = {(x, y)
+            for y in range(height)
+            for x in range(width) if rng.random() < density}
+    # Unfold the pattern, recording the folds in reverse.
+    folds: list[tuple[str, int]] = []
+    for i in range(n_folds):
+        axis = 'x' if i % 2 == 0 else 'y'
+        line = width if axis == 'x' else height
+        if axis == 'x':
+            width = 2 * width + 1
+            dots = {(2 * line - x, y) if rng.random() < 0.5 else (x, y)
+                    for x, y in dots}
+        else:
+            height = 2 * height + 1
+            dots = {(x, 2 * line - y) if rng.random() < 0.5 else (x, y)
+                    for x, y in dots}
+        folds.append((axis, line))
+    dot_lines = [f'{x},{y}' for x, y in dots]
+    rng.shuffle(dot_lines)
+    fold_lines = [
+        f'fold along {axis}={line}' for axis, line in reversed(folds)
+    ]
+    return '\n'.join(dot_lines) + '\n\n' + '\n'.join(fold_lines)
@@ -0,0 +1,19 @@
+import itertools
+import random
+import string
+
+
+def generate(length: int = 20, n_elements: int = 10, seed: int = 0) -> str:
+    """
+    A polymer template of length elements, with an insertion rule for every
+    pair of the n_elements elements.
+    """
+    rng = random.Random(seed)
+    elements = rng.sample(string.ascii_uppercase, n_elements)
+    template = ''.join(rng.choices(elements, k=length))
+    rules = [
+        f'{a}{b} -> {rng.choice(elements)}'
+        for a, b in itertools.product(elements, repeat=2)
+    ]
+    rng.shuffle(rules)
+    return template + '\n\n' + '\n'.join(rules)
@@ -0,0 +1,90 @@
+import random
+from dataclasses import dataclass
+
+SUM, PRODUCT, MINIMUM, MAXIMUM, LITERAL, GT, LT, EQ = range(8)
+COMPARISONS = (GT, LT, EQ)
+MAX_SUB_PACKETS = 2**11 - 1
+
+
+@dataclass
+class OpenOperator:
+    type_id: int
+    length_chunk: int
+    """Index of the chunk holding the length type ID and length."""
+    children_start: int
+    n_children: int = 0
+    prefers_bit_length: bool = True
+
+    def wants_child(self, rng: random.Random, budget_left: bool,
+                    is_root: bool) -> bool:
+        if self.type_id in COMPARISONS:
+            return self.n_children < 2
+        if self.n_children == 0:
+            return True
+        if not budget_left or self.n_children == MAX_SUB_PACKETS:
+            return False
+        return is_root or rng.random() < 0.75
+
+
+def literal_bits(value: int) -> str:
+    nybbles = f'{value:b}'
+    nybbles = nybbles.zfill(-(-len(nybbles) // 4) * 4)
+    groups = [nybbles[i:i + 4] for i in range(0, len(nybbles), 4)]
+    return ''.join(('1' if i < len(groups) - 1 else '0') + g
+                   for i, g in enumerate(groups))
+
+
+def generate(n_packets: int = 50, depth: int = 5, seed: int = 0) -> str:
+    """
+    A BITS transmission of about n_packets packets whose first depth packets
+    are nested operators. Packets are emitted in a single pre-order pass
+    without recursion, so arbitrarily deep transmissions can be generated.
+    """
+    rng = random.Random(seed)
+    chunks: list[str] = []
+    n_bits = 0
+    stack: list[OpenOperator] = []
+    emitted = 0
+    while True:
+        while stack and not stack[-1].wants_child(
+                rng, emitted < n_packets, is_root=len(stack) == 1):
+            op = stack.pop()
+            # Length fields are filled in once the sub-packets are known.
+            length = n_bits - op.children_start
+            if op.prefers_bit_length and length < 2**15:
+                chunks[op.length_chunk] = f'0{length:015b}'
+            else:
+                chunks[op.length_chunk] = f'1{op.n_children:011b}'
+                n_bits -= 4
+        if emitted and not stack:
+            break
+        if stack:
+            stack[-1].n_children += 1
+
+        header = f'{rng.randrange(8):03b}'
+        is_operator = emitted < depth or (emitted < n_packets
+                                          and len(stack) < depth
+                                          and rng.random() < 0.3)
+        emitted += 1
+        if not is_operator:
+            value = rng.randrange(2**rng.choice((4, 8, 16)))
+            chunks.append(header + f'{LITERAL:03b}' + literal_bits(value))
+            n_bits += len(chunks[-1])
+            continue
+
+        type_id = rng.choice((SUM, PRODUCT, MINIMUM, MAXIMUM))
+        if stack and rng.random() < 0.3:
+            type_id = rng.choice(COMPARISONS)
+        chunks.append(header + f'{type_id:03b}')
+        # Reserve room for a bit length, the longer of the two fields.
+        chunks.append('')
+        n_bits += 6 + 16
+        stack.append(
+            OpenOperator(type_id,
+                         len(chunks) - 1,
+                         n_bits,
+                         prefers_bit_length=rng.random() < 0.5))
+
+    bits = ''.join(chunks)
+    bits += '0' * (-len(bits) % 4)
+    return f'{int(bits, 2):0{len(bits) // 4}X}'
@@ -0,0 +1,20 @@
+import math
+import random
+
+
+def generate(scale: int = 100, seed: int = 0) -> str:
+    """
+    A target area about scale units down and across. The x range always
+    contains a triangular number, so some launch stalls above the target
+    and the highest trajectory falls straight into it.
+    """
+    assert scale >= 10, 'scale must be at least 10.'
+    rng = random.Random(seed)
+    y_min = -rng.randint(scale // 2, scale)
+    y_max = y_min + rng.randint(1, abs(y_min) // 2)
+    # Stall at x = k(k+1)/2 after k steps, well before the deepest fall.
+    k = rng.randint(2, max(2, min(math.isqrt(2 * scale), abs(y_min) - 1)))
+    stall = k * (k + 1) // 2
+    x_min = max(1, stall - rng.randint(0, max(1, stall // 5)))
+    x_max = stall + rng.randint(0, max(1, stall // 5))
+    return f'target area: x={x_min}..{x_max}, y={y_min}..{y_max}'
@@ -0,0 +1,18 @@
+import random
+from typing import Union
+
+SnailfishNumber = Union[int, list]
+
+
+def generate(n: int = 100, seed: int = 0) -> str:
+    """n reduced snailfish numbers for the homework assignment."""
+    rng = random.Random(seed)
+
+    def number(depth: int) -> SnailfishNumber:
+        # Pairs nested inside four pairs would explode, and values of 10
+        # or more would split, so neither appears in a reduced number.
+        if depth > 4 or (depth > 1 and rng.random() < 0.3):
+            return rng.randint(0, 9)
+        return [number(depth + 1), number(depth + 1)]
+
+    return '\n'.join(str(number(1)).replace(' ', '') for _ in range(n))
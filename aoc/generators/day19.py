@@ -0,0 +1,87 @@
+import itertools
+import random
+from typing import Sequence
+
+Vector = tuple[int, int, int]
+Rotation = tuple[tuple[int, ...], tuple[int, ...]]
+"""An axis permutation and the sign of each axis."""
+
+SCANNER_RANGE = 1000
+
+
+def rotations() -> list[Rotation]:
+    """The 24 orientations, as (axis permutation, axis signs)."""
+    result = []
+    for permutation in itertools.permutations(range(3)):
+        # The parity of the permutation decides which signs keep the
+        # handedness of the coordinate system.
+        parity = sum(permutation[i] > permutation[j]
+                     for i, j in itertools.combinations(range(3), 2)) % 2
+        for signs in itertools.product((1, -1), repeat=3):
+            if (signs[0] * signs[1] * signs[2] == 1) != bool(parity):
+                result.append((permutation, signs))
+    return result
+
+
+def rotate(p: Vector, rotation: Rotation) -> Vector:
+    permutation, signs = rotation
+    return (p[permutation[0]] * signs[0], p[permutation[1]] * signs[1],
+            p[permutation[2]] * signs[2])
+
+
+def in_range(beacon: Vector, scanner: Vector) -> bool:
+    return all(abs(b - s) <= SCANNER_RANGE for b, s in zip(beacon, scanner))
+
+
+def random_point(rng: random.Random, low: Sequence[int],
+                 high: Sequence[int]) -> Vector:
+    return (rng.randint(low[0], high[0]), rng.randint(low[1], high[1]),
+            rng.randint(low[2], high[2]))
+
+
+def generate(n_scanners: int = 5,
+             beacons_per_scanner: int = 25,
+             min_overlap: int = 12,
+             seed: int = 0) -> str:
+    """
+    Reports from n_scanners scanners. Scanners are placed in a chain, where
+    each scanner shares at least min_overlap beacons with the one before
+    it, and every report lists all beacons within range in the scanner's
+    own orientation. Scanner 0 is the reference orientation.
+    """
+    rng = random.Random(seed)
+    scanners: list[Vector] = [(0, 0, 0)]
+    for _ in range(n_scanners - 1):
+        x, y, z = scanners[-1]
+        step = random_point(rng, (-1200, -1200, -1200), (1200, 1200, 1200))
+        scanners.append((x + step[0], y + step[1], z + step[2]))
+
+    beacons: set[Vector] = set()
+    for a, b in itertools.pairwise(scanners):
+        low = [max(i, j) - SCANNER_RANGE for i, j in zip(a, b)]
+        high = [min(i, j) + SCANNER_RANGE for i, j in zip(a, b)]
+        shared = {p for p in beacons if in_range(p, a) and in_range(p, b)}
+        while len(shared) < min_overlap:
+            p = random_point(rng, low, high)
+            beacons.add(p)
+            shared.add(p)
+    for s in scanners:
+        seen = sum(in_range(p, s) for p in beacons)
+        for _ in range(beacons_per_scanner - seen):
+            beacons.add(
+                random_point(rng, [c - SCANNER_RANGE for c in s],
+                             [c + SCANNER_RANGE for c in s]))
+
+    orientations = rotations()
+    reports: list[str] = []
+    for i, s in enumerate(scanners):
+        rotation = orientations[0] if i == 0 else rng.choice(orientations)
+        visible = [
+            rotate((p[0] - s[0], p[1] - s[1], p[2] - s[2]), rotation)
+            for p in beacons if in_range(p, s)
+        ]
+        rng.shuffle(visible)
+        lines = [f'--- scanner {i} ---']
+        lines.extend(f'{x},{y},{z}' for x, y, z in visible)
+        reports.append('\n'.join(lines))
+    return '\n\n'.join(reports)
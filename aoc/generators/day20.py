@@ -0,0 +1,22 @@
+import random
+
+
+def generate(rows: int = 100,
+             cols: int = 100,
+             flashing_background: bool = True,
+             seed: int = 0) -> str:
+    """
+    An image enhancement algorithm and a rows x cols input image. With
+    flashing_background, the infinite dark background lights up on odd
+    enhancements, as it does in the real puzzle inputs.
+    """
+    rng = random.Random(seed)
+    algorithm = rng.choices('.#', k=512)
+    # The background must go dark again after lighting up, or it would
+    # stay infinitely bright.
+    if flashing_background:
+        algorithm[0], algorithm[-1] = '#', '.'
+    else:
+        algorithm[0] = '.'
+    image = (''.join(rng.choices('.#', k=cols)) for _ in range(rows))
+    return ''.join(algorithm) + '\n\n' + '\n'.join(image)
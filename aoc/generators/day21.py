@@ -0,0 +1,8 @@
+import random
+
+
+def generate(seed: int = 0) -> str:
+    """Starting positions for both players. The board has a fixed size."""
+    rng = random.Random(seed)
+    return (f'Player 1 starting position: {rng.randint(1, 10)}\n'
+            f'Player 2 starting position: {rng.randint(1, 10)}')
@@ -0,0 +1,30 @@
+import random
+
+
+def cuboid(rng: random.Random, extent: int, size: int) -> str:
+    ranges: list[str] = []
+    for axis in 'xyz':
+        low = rng.randint(-extent, extent - size)
+        high = low + rng.randint(0, size)
+        ranges.append(f'{axis}={low}..{high}')
+    return ','.join(ranges)
+
+
+def generate(n: int = 420,
+             n_initialization: int = 20,
+             extent: int = 100_000,
+             seed: int = 0) -> str:
+    """
+    n reboot steps. The first n_initialization steps only touch the
+    -50..50 initialization region; the rest span -extent..extent.
+    """
+    rng = random.Random(seed)
+    steps: list[str] = []
+    for i in range(n):
+        command = 'on' if i == 0 or rng.random() < 0.6 else 'off'
+        if i < n_initialization:
+            region = cuboid(rng, 50, 50)
+        else:
+            region = cuboid(rng, extent, extent // 2)
+        steps.append(f'{command} {region}')
+    return '\n'.join(steps)
@@ -0,0 +1,16 @@
+import random
+
+
+def generate(seed: int = 0) -> str:
+    """A burrow with two amphipods of each type shuffled into the rooms."""
+    rng = random.Random(seed)
+    amphipods = list('AABBCCDD')
+    rng.shuffle(amphipods)
+    top, bottom = amphipods[:4], amphipods[4:]
+    return '\n'.join([
+        '#############',
+        '#...........#',
+        '###' + '#'.join(top) + '###',
+        '  #' + '#'.join(bottom) + '#',
+        '  #########',
+    ])
@@ -0,0 +1,59 @@
+import random
+
+BLOCK = """inp w
+mul x 0
+add x z
+mod x 26
+div z {divisor}
+add x {check}
+eql x w
+eql x 0
+mul y 0
+add y 25
+mul y x
+add y 1
+mul z y
+mul y 0
+add y w
+add y {offset}
+mul y x
+add z y"""
+
+
+def generate(n_digits: int = 14, seed: int = 0) -> str:
+    """
+    A MONAD program checking n_digits digit model numbers, built from the
+    same block as the real puzzle inputs. Each block either pushes a digit
+    onto z, a base 26 stack, or pops one and requires the current digit to
+    differ from it by a fixed amount. The pushes and pops are balanced and
+    every difference is between -8 and 8, so some model number is valid.
+    """
+    assert n_digits % 2 == 0, 'n_digits must be even.'
+    rng = random.Random(seed)
+    # A random sequence of balanced pushes (True) and pops (False).
+    pushes_left, depth = n_digits // 2, 0
+    sequence: list[bool] = []
+    for _ in range(n_digits):
+        push = depth == 0 or (pushes_left > 0 and rng.random() < 0.5)
+        sequence.append(push)
+        pushes_left -= push
+        depth += 1 if push else -1
+
+    blocks: list[str] = []
+    offsets: list[int] = []
+    for push in sequence:
+        if push:
+            offset = rng.randint(1, 16)
+            offsets.append(offset)
+            # A check of 10 or more can never equal a digit, so z grows.
+            blocks.append(
+                BLOCK.format(divisor=1,
+                             check=rng.randint(10, 16),
+                             offset=offset))
+        else:
+            difference = rng.randint(-8, 8)
+            blocks.append(
+                BLOCK.format(divisor=26,
+                             check=difference - offsets.pop(),
+                             offset=rng.randint(1, 16)))
+    return '\n'.join(blocks)
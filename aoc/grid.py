@@ -0,0 +1,14 @@
+import numpy as np
+
+
+def parse_digits(input_data: str) -> np.ndarray:
+    """A grid of single-digit numbers as a (rows x cols) uint8 array."""
+    data = input_data.strip().encode('ascii') + b'\n'
+    width = data.index(b'\n')
+    raw = np.frombuffer(data, dtype=np.uint8)
+    if len(raw) % (width + 1) == 0:
+        # View the grid as a matrix, with newlines in the last column.
+        matrix = raw.reshape(-1, width + 1)
+        if (matrix[:, width] == ord('\n')).all():
+            return matrix[:, :width] - ord('0')
+    raise ValueError('Every row of the grid must be the same width.')
@@ -0,0 +1,138 @@
+import hashlib
+import mmap
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Iterator, Optional, Union
+
+YEAR = 2021
+
+
+def default_cache_dir() -> Path:
+    """$AOC_CACHE_DIR, otherwise $XDG_CACHE_HOME/aoc (~/.cache/aoc)."""
+    if cache_dir := os.environ.get('AOC_CACHE_DIR'):
+        return Path(cache_dir)
+    xdg_cache_home = os.environ.get('XDG_CACHE_HOME') or '~/.cache'
+    return Path(xdg_cache_home).expanduser() / 'aoc'
+
+
+def digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def read_line_chunks(f: IO[str], chunk_size: int = 1 << 20) -> Iterator[str]:
+    """
+    Read a text file in pieces of about chunk_size characters, each ending on
+    a line boundary, so that files larger than memory can be processed.
+    """
+    remainder = ''
+    while text := f.read(chunk_size):
+        text = remainder + text
+        # Hold back the last line, which may continue in the next read.
+        end = text.rfind('\n') + 1
+        chunk, remainder = text[:end], text[end:]
+        if chunk:
+            yield chunk
+    if remainder:
+        yield remainder
+
+
+class InputStore:
+    """
+    Puzzle inputs on the local filesystem, keyed by year and day. Each input
+    is stored next to the sha256 digest of its content, so a truncated or
+    hand-edited file can be detected before a solver sees it.
+    """
+
+    def __init__(self, root: Optional[Path] = None):
+        self.root = root if root is not None else default_cache_dir()
+
+    def path(self, day: int, year: int = YEAR) -> Path:
+        return self.root / str(year) / f'day{day:02d}.txt'
+
+    def digest_path(self, day: int, year: int = YEAR) -> Path:
+        return self.path(day, year).with_suffix('.sha256')
+
+    def __contains__(self, key: Union[int, tuple[int, int]]) -> bool:
+        day, year = (key, YEAR) if isinstance(key, int) else key
+        return self.path(day, year).is_file()
+
+    def put(self, day: int, data: Union[str, bytes], year: int = YEAR) -> str:
+        """Store an input, returning the digest of its content."""
+        if isinstance(data, str):
+            data = data.encode()
+        path = self.path(day, year)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        content_digest = digest(data)
+        # Write to a temporary file first so readers never see partial data.
+        tmp = path.with_suffix('.tmp')
+        tmp.write_bytes(data)
+        self.digest_path(day, year).write_text(content_digest + '\n')
+        tmp.replace(path)
+        return content_digest
+
+    def verify(self, day: int, year: int = YEAR) -> bool:
+        try:
+            expected = self.digest_path(day, year).read_text().strip()
+        except FileNotFoundError:
+            return False
+        return digest(self.read_bytes(day, year)) == expected
+
+    def read_bytes(self, day: int, year: int = YEAR) -> bytes:
+        return self.path(day, year).read_bytes()
+
+    def read_text(self, day: int, year: int = YEAR) -> str:
+        # Trailing newlines are stripped, matching aocd's Puzzle.input_data.
+        return self.read_bytes(day, year).decode().rstrip('\r\n')
+
+    @contextmanager
+    def open_mmap(self,
+                  day: int,
+                  year: int = YEAR) -> Iterator[Union[mmap.mmap, bytes]]:
+        """
+        Map an input into memory read-only. Pages are loaded on demand, so
+        solvers that stream over their input never hold all of it at once.
+        """
+        with open(self.path(day, year), 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                # Empty files cannot be mapped.
+                yield b''
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                yield m
+
+    def fetch(self, day: int, year: int = YEAR) -> str:
+        """Download an input with aocd and store it, returning its text."""
+        from aocd.models import Puzzle as AocdPuzzle
+        data = AocdPuzzle(year=year, day=day).input_data
+        self.put(day, data, year)
+        return data
+
+
+class Puzzle:
+    """
+    A stand-in for aocd.models.Puzzle that reads inputs from an InputStore,
+    only going to the network on a cache miss. With offline=True (or
+    $AOC_OFFLINE set) a cache miss raises FileNotFoundError instead.
+    """
+
+    def __init__(self,
+                 year: int,
+                 day: int,
+                 store: Optional[InputStore] = None,
+                 offline: Optional[bool] = None):
+        self.year = year
+        self.day = day
+        self.store = store if store is not None else InputStore()
+        self.offline = (bool(os.environ.get('AOC_OFFLINE'))
+                        if offline is None else offline)
+
+    @property
+    def input_data(self) -> str:
+        if (self.day, self.year) in self.store:
+            return self.store.read_text(self.day, self.year)
+        if self.offline:
+            raise FileNotFoundError(
+                f'Input for {self.year} day {self.day} is not cached in '
+                f'{self.store.root}.')
+        return self.store.fetch(self.day, self.year)
@@ -0,0 +1,54 @@
+from typing import Optional, Sequence
+
+import numpy as np
+
+
+class MatrixPowers:
+    """
+    Powers of a square integer matrix by repeated squaring. Entries are
+    Python ints held in object arrays, so results are exact however large
+    they grow; give a modulus to keep them bounded instead. Every squaring
+    is kept, so a batch of queries for different powers shares the work of
+    computing them.
+    """
+
+    def __init__(self,
+                 matrix: Sequence[Sequence[int]],
+                 modulus: Optional[int] = None):
+        square = np.array(matrix, dtype=object)
+        assert square.ndim == 2 and square.shape[0] == square.shape[1], \
+            'must be a square matrix.'
+        self.modulus = modulus
+        self._squares = [self._reduce(square)]
+        """matrix ** (2 ** k) for each k computed so far."""
+
+    def _reduce(self, m: np.ndarray) -> np.ndarray:
+        return m if self.modulus is None else m % self.modulus
+
+    def square(self, k: int) -> np.ndarray:
+        """matrix ** (2 ** k)"""
+        while len(self._squares) <= k:
+            last = self._squares[-1]
+            self._squares.append(self._reduce(last @ last))
+        return self._squares[k]
+
+    def power(self, n: int) -> np.ndarray:
+        assert n >= 0, 'n must not be negative.'
+        size = len(self._squares[0])
+        result = self._reduce(np.identity(size, dtype=int).astype(object))
+        for k in range(n.bit_length()):
+            if n >> k & 1:
+                result = self._reduce(result @ self.square(k))
+        return result
+
+    def apply(self, n: int, vector: Sequence[int]) -> np.ndarray:
+        """
+        matrix ** n @ vector, without forming the power itself: the squarings
+        commute, so each one can be applied to the vector in turn.
+        """
+        assert n >= 0, 'n must not be negative.'
+        result = self._reduce(np.array(vector, dtype=object))
+        for k in range(n.bit_length()):
+            if n >> k & 1:
+                result = self._reduce(self.square(k) @ result)
+        return result
@@ -0,0 +1,271 @@
+import importlib
+import json
+import math
+import pkgutil
+import re
+import resource
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
+
+import aoc
+from aoc.inputs import YEAR, InputStore, Puzzle, default_cache_dir
+
+DAY_MODULE_PATTERN = re.compile(r'^day(\d{2})$')
+PARTS = (1, 2)
+
+
+@dataclass(frozen=True)
+class PartResult:
+    day: int
+    part: int
+    answer: Any = None
+    error: Optional[str] = None
+    wall_time: float = 0.0
+    """Seconds spent inside the solver."""
+    peak_rss: Optional[int] = None
+    """Peak resident set size of the process in bytes."""
+    tracemalloc_peak: Optional[int] = None
+    """Peak bytes allocated by Python while the solver ran."""
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def discover_days() -> dict[int, str]:
+    """Map each day number to the name of its dayNN module."""
+    days: dict[int, str] = {}
+    for module_info in pkgutil.iter_modules(aoc.__path__):
+        if match := DAY_MODULE_PATTERN.match(module_info.name):
+            days[int(match.group(1))] = f'{aoc.__name__}.{module_info.name}'
+    return dict(sorted(days.items()))
+
+
+def load_solver(day: int, part: int) -> Callable[[str], Any]:
+    module = importlib.import_module(discover_days()[day])
+    return getattr(module, f'part{part}')
+
+
+def input_path(input_dir: Path, day: int) -> Path:
+    return input_dir / f'day{day:02d}.txt'
+
+
+def read_input(input_dir: Path, day: int) -> str:
+    # Trailing newlines are stripped, matching aocd's Puzzle.input_data.
+    return input_path(input_dir, day).read_text().rstrip('\r\n')
+
+
+def load_input(day: int,
+               input_dir: Optional[Path] = None,
+               store: Optional[InputStore] = None,
+               offline: Optional[bool] = None) -> str:
+    """
+    Read an input from input_dir when one is given, otherwise from the local
+    input store.
+    """
+    if input_dir is not None:
+        return read_input(input_dir, day)
+    return Puzzle(YEAR, day, store, offline).input_data
+
+
+def _reset_peak_rss() -> bool:
+    """
+    Reset the kernel's high-water mark for this process so that the next
+    reading of peak RSS covers only the work done after this call. This is
+    only supported on Linux; elsewhere peak RSS is cumulative.
+    """
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+        return True
+    except OSError:
+        return False
+
+
+def _peak_rss() -> int:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere.
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def _read_vm_hwm() -> Optional[int]:
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+def profile_part(day: int,
+                 part: int,
+                 solver: Callable[[str], Any],
+                 input_data: str,
+                 trace_memory: bool = True) -> PartResult:
+    """
+    Run a single solver, measuring wall time, peak RSS and (optionally) the
+    tracemalloc peak. Tracing allocations slows most solvers down noticeably,
+    so disable trace_memory when only the timings matter.
+    """
+    rss_was_reset = _reset_peak_rss()
+    if trace_memory:
+        tracemalloc.start()
+    answer, error = None, None
+    start = time.perf_counter()
+    try:
+        answer = solver(input_data)
+    except Exception as e:
+        error = f'{type(e).__name__}: {e}'
+    wall_time = time.perf_counter() - start
+    traced_peak = None
+    if trace_memory:
+        _, traced_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    peak_rss = (_read_vm_hwm() if rss_was_reset else None) or _peak_rss()
+    return PartResult(day, part, answer, error, wall_time, peak_rss,
+                      traced_peak)
+
+
+class TimingHistory:
+    """
+    The wall time of each part's last successful run, kept as JSON so that
+    parallel runs can start the slowest parts first.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path if path is not None else (default_cache_dir() /
+                                                   'timings.json')
+        try:
+            self.timings: dict[str, float] = json.loads(self.path.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.timings = {}
+
+    @staticmethod
+    def key(day: int, part: int) -> str:
+        return f'day{day:02d}.part{part}'
+
+    def expected(self, day: int, part: int) -> Optional[float]:
+        return self.timings.get(self.key(day, part))
+
+    def record(self, results: Iterable[PartResult]) -> None:
+        for r in results:
+            if r.ok:
+                self.timings[self.key(r.day, r.part)] = r.wall_time
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self.timings, indent=2,
+                                        sort_keys=True))
+
+
+def _run_part(day: int, part: int, input_data: str,
+              trace_memory: bool) -> PartResult:
+    return profile_part(day, part, load_solver(day, part), input_data,
+                        trace_memory)
+
+
+Task = tuple[int, int, str]
+"""(day, part, input_data)"""
+
+
+def schedule(tasks: Iterable[Task],
+             history: Optional[TimingHistory]) -> list[Task]:
+    """Order tasks longest expected first."""
+
+    def expected_time(task: Task) -> float:
+        # Parts that have never been timed might be slow, so they go first.
+        previous = history.expected(task[0], task[1]) if history else None
+        return math.inf if previous is None else previous
+
+    return sorted(tasks, key=expected_time, reverse=True)
+
+
+def run(days: Iterable[int],
+        parts: Iterable[int] = PARTS,
+        input_dir: Optional[Path] = None,
+        trace_memory: bool = True,
+        store: Optional[InputStore] = None,
+        offline: Optional[bool] = None,
+        jobs: int = 1,
+        history: Optional[TimingHistory] = None) -> list[PartResult]:
+    """
+    Run and profile each selected part, returning results ordered by day and
+    then part as given. With jobs other than 1 the parts run in a pool of
+    that many processes (0 for one per CPU), longest expected first, so that
+    a few slow days don't leave the other workers idle at the end.
+    """
+    days, parts = list(days), list(parts)
+    available = discover_days()
+    results: dict[tuple[int, int], PartResult] = {}
+    tasks: list[Task] = []
+    for day in days:
+        if day not in available:
+            raise ValueError(f'No solver module for day {day}.')
+        try:
+            input_data = load_input(day, input_dir, store, offline)
+        except Exception as e:
+            error = f'Could not load input: {e}'
+            for part in parts:
+                results[day, part] = PartResult(day, part, error=error)
+            continue
+        tasks.extend((day, part, input_data) for part in parts)
+
+    if jobs == 1:
+        for day, part, input_data in tasks:
+            results[day, part] = _run_part(day, part, input_data, trace_memory)
+    else:
+        tasks = schedule(tasks, history)
+        with ProcessPoolExecutor(max_workers=jobs or None) as pool:
+            futures = {
+                pool.submit(_run_part, day, part, input_data, trace_memory):
+                (day, part)
+                for day, part, input_data in tasks
+            }
+            for future in as_completed(futures):
+                day, part = futures[future]
+                try:
+                    results[day, part] = future.result()
+                except Exception as e:
+                    results[day, part] = PartResult(
+                        day, part, error=f'{type(e).__name__}: {e}')
+
+    ordered = [results[day, part] for day in days for part in parts]
+    if history is not None:
+        history.record(ordered)
+        history.save()
+    return ordered
+
+
+def format_bytes(n: Optional[int]) -> str:
+    if n is None:
+        return '-'
+    size = float(n)
+    for unit in ('B', 'KiB', 'MiB'):
+        if size < 1024:
+            return f'{size:.1f} {unit}'
+        size /= 1024
+    return f'{size:.1f} GiB'
+
+
+def format_results(results: Iterable[PartResult]) -> str:
+    header = (f'{"day":>3} {"part":>4} {"time (s)":>10} {"peak RSS":>11} '
+              f'{"tracemalloc":>11}  answer')
+    lines = [header]
+    for r in results:
+        if r.ok:
+            first, *rest = str(r.answer).splitlines() or ['']
+        else:
+            first, rest = f'!! {r.error}', []
+        lines.append(f'{r.day:>3} {r.part:>4} {r.wall_time:>10.3f} '
+                     f'{format_bytes(r.peak_rss):>11} '
+                     f'{format_bytes(r.tracemalloc_peak):>11}  {first}')
+        indent = ' ' * (len(header) - len('answer'))
+        lines.extend(indent + line for line in rest)
+    return '\n'.join(lines)
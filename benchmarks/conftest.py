@@ -0,0 +1,185 @@
+import json
+import platform
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import pytest
+
+from aoc.inputs import InputStore
+
+DEFAULT_BASELINE = Path(__file__).parent / 'baseline.json'
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup('benchmark')
+    group.addoption('--baseline',
+                    type=Path,
+                    default=DEFAULT_BASELINE,
+                    help='JSON file of baseline timings to compare against.')
+    group.addoption('--save-baseline',
+                    action='store_true',
+                    help='Write the timings of this run to the baseline.')
+    group.addoption(
+        '--regression-threshold',
+        type=float,
+        default=0.25,
+        help='Fail a benchmark that is slower than its baseline by more than '
+        'this fraction (default: 0.25).')
+    group.addoption(
+        '--regression-min-delta',
+        type=float,
+        default=0.005,
+        help='Ignore slowdowns smaller than this many seconds, which are '
+        'dominated by noise (default: 0.005).')
+    group.addoption('--rounds',
+                    type=int,
+                    default=3,
+                    help='Times to run each benchmark; the fastest counts.')
+    group.addoption(
+        '--bench-scale',
+        type=float,
+        default=1.0,
+        help='Multiply the size of the scaled-up inputs by this factor.')
+    group.addoption(
+        '--input-store',
+        type=Path,
+        default=None,
+        help='Directory of the input store to time real inputs from '
+        '(default: the same store as python -m aoc).')
+
+
+@dataclass
+class Result:
+    min: float
+    mean: float
+    rounds: int
+    extra_info: dict[str, Any] = field(default_factory=dict)
+
+
+results_key = pytest.StashKey[dict[str, Result]]()
+
+
+def pytest_configure(config):
+    config.stash[results_key] = {}
+
+
+def load_baseline(path: Path) -> dict[str, Any]:
+    try:
+        return json.loads(path.read_text())
+    except FileNotFoundError:
+        return {'benchmarks': {}}
+
+
+class Benchmark:
+    """
+    A minimal stand-in for pytest-benchmark's fixture: call it with the
+    function under test and its arguments. Anything that changes the
+    workload, like the input size, belongs in extra_info; timings are only
+    compared against a baseline recorded with the same extra_info.
+    """
+
+    def __init__(self, name: str, config: pytest.Config,
+                 baseline: Optional[dict[str, Any]]):
+        self.name = name
+        self.config = config
+        self.baseline = baseline
+        self.extra_info: dict[str, Any] = {}
+
+    def __call__(self, func: Callable, *args, **kwargs) -> Any:
+        return self.pedantic(func, args, kwargs)
+
+    def pedantic(self,
+                 target: Callable,
+                 args: tuple = (),
+                 kwargs: Optional[dict[str, Any]] = None,
+                 setup: Optional[Callable[[], None]] = None,
+                 rounds: Optional[int] = None) -> Any:
+        """
+        Like calling the fixture, but setup runs untimed before every round,
+        e.g. to clear a cache that would otherwise make later rounds free.
+        """
+        rounds = rounds or self.config.getoption('rounds')
+        timings: list[float] = []
+        result = None
+        for _ in range(rounds):
+            if setup is not None:
+                setup()
+            start = time.perf_counter()
+            result = target(*args, **(kwargs or {}))
+            timings.append(time.perf_counter() - start)
+        measured = Result(min(timings),
+                          sum(timings) / rounds, rounds, dict(self.extra_info))
+        self.config.stash[results_key][self.name] = measured
+        self.check_regression(measured)
+        return result
+
+    def check_regression(self, measured: Result) -> None:
+        if self.config.getoption('save_baseline') or self.baseline is None:
+            return
+        if self.baseline.get('extra_info', {}) != measured.extra_info:
+            return
+        threshold = self.config.getoption('regression_threshold')
+        min_delta = self.config.getoption('regression_min_delta')
+        limit = self.baseline['min'] * (1 + threshold)
+        if (measured.min > limit
+                and measured.min - self.baseline['min'] > min_delta):
+            pytest.fail(f'{self.name} took {measured.min:.4f}s, more than '
+                        f'{threshold:.0%} slower than the baseline of '
+                        f'{self.baseline["min"]:.4f}s.')
+
+
+@pytest.fixture(scope='session')
+def baseline(pytestconfig) -> dict[str, Any]:
+    return load_baseline(pytestconfig.getoption('baseline'))['benchmarks']
+
+
+@pytest.fixture
+def benchmark(request, baseline) -> Benchmark:
+    name = request.node.name
+    return Benchmark(name, request.config, baseline.get(name))
+
+
+@pytest.fixture(scope='session')
+def bench_scale(pytestconfig) -> float:
+    return pytestconfig.getoption('bench_scale')
+
+
+@pytest.fixture(scope='session')
+def input_store(pytestconfig) -> InputStore:
+    return InputStore(pytestconfig.getoption('input_store'))
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    if not config.getoption('save_baseline', False):
+        return
+    path = config.getoption('baseline')
+    saved = load_baseline(path)
+    saved['machine'] = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'processor': platform.processor(),
+    }
+    # Merge, so that saving a subset of benchmarks keeps the others.
+    for name, result in config.stash[results_key].items():
+        saved['benchmarks'][name] = vars(result)
+    saved['benchmarks'] = dict(sorted(saved['benchmarks'].items()))
+    path.write_text(json.dumps(saved, indent=2) + '\n')
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    results = config.stash.get(results_key, {})
+    if not results:
+        return
+    baseline = load_baseline(config.getoption('baseline'))['benchmarks']
+    terminalreporter.section('benchmarks')
+    for name, result in results.items():
+        line = f'{name:<40} {result.min:>10.4f}s'
+        previous = baseline.get(name)
+        if (previous and previous['min']
+                and previous.get('extra_info', {}) == result.extra_info):
+            ratio = result.min / previous['min']
+            line += f' {ratio:>8.2f}x baseline'
+        terminalreporter.write_line(line)
@@ -0,0 +1,173 @@
+import math
+
+import networkx
+import pytest
+
+from aoc.day06 import lanternfish
+from aoc.day14 import polymer
+from aoc.day21 import dirac
+from aoc.day24 import Execution
+from aoc.runner import discover_days, load_solver, profile_part
+from aoc.generators import generate
+from tests import (test_day01, test_day02, test_day03, test_day04, test_day05,
+                   test_day06, test_day07, test_day08, test_day09, test_day10,
+                   test_day11, test_day12, test_day13, test_day14, test_day15,
+                   test_day16, test_day17, test_day18, test_day19, test_day20,
+                   test_day21, test_day22, test_day23, test_day24)
+
+samples = {
+    1: test_day01.input_data,
+    2: test_day02.input_data,
+    3: test_day03.input_data,
+    4: test_day04.input_data,
+    5: test_day05.input_data,
+    6: test_day06.input_data,
+    7: test_day07.input_data,
+    8: test_day08.input_data,
+    9: test_day09.input_data,
+    10: test_day10.input_data,
+    11: test_day11.input_data,
+    12: test_day12.input_data_3,
+    13: test_day13.input_data,
+    14: test_day14.input_data,
+    15: test_day15.input_data,
+    16: 'A0016C880162017C3686B18A3D4780',
+    17: test_day17.input_data,
+    18: test_day18.input_data,
+    19: test_day19.input_data,
+    20: test_day20.input_data,
+    21: test_day21.input_data,
+    22: test_day22.input_data_large,
+    23: test_day23.input_data,
+}
+
+
+def sample_params():
+    for day, input_data in samples.items():
+        for part in (1, 2):
+            marks = []
+            if day == 23:
+                marks.append(pytest.mark.skip(reason='day 23 is unsolved'))
+            yield pytest.param(day,
+                               part,
+                               input_data,
+                               id=f'day{day:02d}-part{part}-sample',
+                               marks=marks)
+
+
+# Solvers that memoise across calls, and how to reset them between rounds.
+caches = {
+    6: lanternfish.cache_clear,
+    14: polymer.cache_clear,
+    21: dirac.cache_clear
+}
+
+
+@pytest.mark.parametrize('day,part,input_data', list(sample_params()))
+def test_sample(benchmark, day, part, input_data):
+    benchmark.pedantic(load_solver(day, part), (input_data, ),
+                       setup=caches.get(day))
+
+
+def stored_params():
+    for day in discover_days():
+        for part in (1, 2):
+            marks = []
+            if day == 23:
+                marks.append(pytest.mark.skip(reason='day 23 is unsolved'))
+            yield pytest.param(day,
+                               part,
+                               id=f'day{day:02d}-part{part}-stored',
+                               marks=marks)
+
+
+@pytest.mark.parametrize('day,part', list(stored_params()))
+def test_stored(benchmark, input_store, day, part):
+    """Time each part on the real input, if it is in the input store."""
+    if day not in input_store:
+        pytest.skip(f'day {day} is not in {input_store.root}; run '
+                    'python -m aoc cache to fill the store')
+    if not input_store.verify(day):
+        pytest.fail(f'day {day} in {input_store.root} fails its digest check')
+    benchmark.extra_info['sha256'] = input_store.digest_path(
+        day).read_text().strip()
+    benchmark.pedantic(load_solver(day, part), (input_store.read_text(day), ),
+                       setup=caches.get(day))
+
+
+def test_day24_alu(benchmark):
+    # Part 1 is an open-ended search, so time the ALU interpreter it drives.
+    instructions = test_day24.int_to_binary_program.splitlines()
+    benchmark(
+        lambda:
+        [Execution(instructions, str(n)).execute() for n in range(1, 10)])
+
+
+def networkx_basins(input_data: str) -> int:
+    """The networkx graph that day 9's basin finder replaced."""
+    lines = input_data.splitlines()
+    g = networkx.grid_2d_graph(len(lines), len(lines[0]))
+    g.remove_nodes_from([(row, col) for row, line in enumerate(lines)
+                         for col, height in enumerate(line) if height == '9'])
+    sizes = sorted(len(c) for c in networkx.connected_components(g))
+    return math.prod(sizes[-3:])
+
+
+def test_day09_memory(bench_scale, record_property):
+    input_data = grid(9, max(1, round(40_000 * bench_scale)))
+    arrays = profile_part(9, 2, load_solver(9, 2), input_data)
+    graph = profile_part(9, 2, networkx_basins, input_data)
+    assert arrays.answer == graph.answer
+    record_property('tracemalloc_peak', arrays.tracemalloc_peak)
+    record_property('networkx_tracemalloc_peak', graph.tracemalloc_peak)
+    assert arrays.tracemalloc_peak * 5 < graph.tracemalloc_peak
+
+
+def grid(day: int, n: int) -> str:
+    side = max(1, math.isqrt(n))
+    return generate(day, rows=side, cols=side)
+
+
+def scaled_params():
+    """
+    (day, parts, size, make_input), where size is the workload at a
+    --bench-scale of 1 and make_input turns a scaled size into an input.
+    """
+    yield 1, (1, 2), 1_000_000, lambda n: generate(1, n=n)
+    yield 2, (1, 2), 10_000_000, lambda n: generate(2, n=n)
+    yield 3, (1, 2), 1_000_000, lambda n: generate(3, n=n, width=64)
+    yield 4, (1, 2), 100_000, lambda n: generate(4, n_boards=n)
+    yield 5, (1, 2), 5_000, lambda n: generate(5, n=n)
+    yield 7, (1,
+              2), 1_000_000, lambda n: generate(7, n=n, max_position=n // 10)
+    yield 8, (1, 2), 1_000_000, lambda n: generate(8, n=n)
+    yield 9, (1, 2), 1_000_000, lambda n: grid(9, n)
+    # Part 2 may never synchronise on a random grid.
+    yield 11, (1, ), 1_000_000, lambda n: grid(11, n)
+    yield 12, (1, 2), 12, lambda n: generate(
+        12, n_small=n, n_large=max(1, n // 4), n_edges=2 * n)
+    # The real puzzle's size: a 20 element template over 10 elements.
+    yield 14, (1, 2), 20, lambda n: generate(14, length=max(2, n))
+    yield 15, (1, ), 1_000_000, lambda n: grid(15, n)
+    # Part 2 tiles its input 5x5, so this searches 5000x5000 cells.
+    yield 15, (2, ), 1_000_000, lambda n: grid(15, n)
+    yield 16, (1, 2), 100_000, lambda n: generate(16, n_packets=n, depth=100)
+    yield 17, (1, 2), 1_000_000, lambda n: generate(17, scale=max(10, n))
+    # Part 2 adds every ordered pair, in a process pool from 500 numbers.
+    yield 18, (2, ), 1_000, lambda n: generate(18, n=max(2, n))
+    yield 19, (1, 2), 30, lambda n: generate(19, n_scanners=max(2, n))
+    yield 22, (1, 2), 1_000, lambda n: generate(22, n=n)
+
+
+@pytest.mark.parametrize('part', (1, 2), ids=('part1', 'part2'))
+@pytest.mark.parametrize('day,parts,size,make_input', [
+    pytest.param(*params, id=f'day{params[0]:02d}-{params[2]}')
+    for params in scaled_params()
+])
+def test_scaled(benchmark, bench_scale, day, parts, size, make_input, part):
+    if part not in parts:
+        pytest.skip(f'day {day} part {part} has no scaled benchmark')
+    n = max(1, round(size * bench_scale))
+    benchmark.extra_info['size'] = n
+    input_data = make_input(n)
+    benchmark(load_solver(day, part), input_data)
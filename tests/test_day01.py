@@ -1,4 +1,9 @@
-from aoc.day01 import part1, part2
+from io import StringIO
+
+import numpy as np
+
+from aoc.day01 import (part1, part2, count_increases, count_increases_array,
+                       count_increases_chunked, read_chunks)
 
 input_data = """199
 200
@@ -19,3 +24,31 @@ def test_part1():
 
 def test_part2():
     assert part2(input_data) == 5
+
+
+def test_count_increases():
+    depths = [int(n) for n in input_data.split()]
+    assert count_increases(depths) == 7
+    assert count_increases(iter(depths), window=3) == 5
+    assert count_increases(depths, window=10) == 0
+    assert count_increases([1, 2, 3, 0, 9], window=2) == 2
+
+
+def test_count_increases_array():
+    depths = np.array([int(n) for n in input_data.split()])
+    assert count_increases_array(depths) == 7
+    assert count_increases_array(depths, window=3) == 5
+    assert count_increases_array(depths, window=20) == 0
+
+
+def test_read_chunks():
+    chunks = list(read_chunks(StringIO(input_data), chunk_size=7))
+    assert len(chunks) > 1
+    assert np.concatenate(chunks).tolist() == [
+        int(n) for n in input_data.split()
+    ]
+    depths = [int(n) for n in input_data.split()]
+    for window in (1, 3, 7):
+        chunks = read_chunks(StringIO(input_data), chunk_size=5)
+        assert count_increases_chunked(chunks, window) == count_increases(
+            depths, window)
@@ -1,4 +1,8 @@
-from aoc.day02 import part1, part2
+from io import StringIO
+
+import pytest
+
+from aoc.day02 import Course, follow, parse, part1, part2, read_chunks
 
 input_data = """forward 5
 down 5
@@ -15,3 +19,20 @@ def test_part1():
 
 def test_part2():
     assert part2(input_data) == 900
+
+
+def test_parse():
+    opcodes, magnitudes = parse(input_data)
+    assert bytes(opcodes) == b'fdfudf'
+    assert magnitudes.tolist() == [5, 5, 8, 3, 8, 2]
+    with pytest.raises(ValueError):
+        parse('backward 5')
+    assert follow([parse('')]) == Course()
+
+
+def test_read_chunks():
+    chunks = list(read_chunks(StringIO(input_data), chunk_size=10))
+    assert len(chunks) > 1
+    course = follow(chunks)
+    assert course.horizontal * course.aim == 150
+    assert course.horizontal * course.depth == 900
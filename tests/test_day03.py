@@ -1,4 +1,7 @@
-from aoc.day03 import part1, part2
+import numpy as np
+import pytest
+
+from aoc.day03 import parse, part1, part2, to_int
 
 input_data = """00100
 11110
@@ -21,3 +24,15 @@ def test_part1():
 
 def test_part2():
     assert part2(input_data) == 230
+
+
+def test_to_int():
+    assert to_int(np.array([True, False, True])) == 5
+    assert to_int(np.array([True] * 64)) == 2**64 - 1
+    assert to_int(np.array([True] + [False] * 69)) == 2**69
+
+
+def test_parse():
+    assert parse('01\n10').tolist() == [[False, True], [True, False]]
+    with pytest.raises(ValueError):
+        parse('01\n1')
@@ -1,4 +1,4 @@
-from aoc.day04 import part1, part2
+from aoc.day04 import Bingo, part1, part2
 from aoc.day04 import parse
 
 input_data = """7,4,9,5,11,17,23,2,0,14,21,24,10,16,13,6,15,25,12,22,18,20,8,19,3,26,1
@@ -29,3 +29,18 @@ def test_part1():
 
 def test_part2():
     assert part2(input_data) == 1924
+
+
+def test_bingo():
+    sequence, boards = parse(input_data)
+    assert boards.shape == (3, 5, 5)
+    bingo = Bingo(boards)
+    assert [bingo.call(n).tolist() for n in sequence[:12]] == [[]] * 11 + [[2]]
+    assert bingo.call(24).tolist() == []
+    assert bingo.score(2) == 4512
+    assert bingo.play(sequence).tolist() == [13, 14, 11]
+
+
+def test_side_length():
+    assert part1('3,1,2,9\n\n1 2\n3 4\n\n5 9\n2 3') == (2 + 4) * 1
+    assert part2('3,1,2,9\n\n1 2\n3 4\n\n5 9\n2 3') == (5 + 9) * 2
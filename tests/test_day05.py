@@ -1,4 +1,4 @@
-from aoc.day05 import part1, part2, Line, Point
+from aoc.day05 import count_overlaps, parse, part1, part2, rasterise
 
 input_data = """0,9 -> 5,9
 8,0 -> 0,8
@@ -21,16 +21,42 @@ def test_part2():
     assert part2(input_data) == 12
 
 
-def test_walk():
-    line = Line.from_string('1,1 -> 3,1')
-    assert {Point(1, 1), Point(2, 1), Point(3, 1)} == set(line.walk())
-
-    line = Line.from_string('5,2 -> 5,1')
-    assert {Point(5, 2), Point(5, 1)} == set(line.walk())
-
-    line = Line.from_string('0,0 -> 3,3')
-    assert {Point(0, 0), Point(1, 1),
-            Point(2, 2), Point(3, 3)} == set(line.walk())
-
-    line = Line.from_string('2,2 -> 0,0')
-    assert {Point(2, 2), Point(1, 1), Point(0, 0)} == set(line.walk())
+def test_rasterise_single_lines():
+    assert rasterise(parse('1,1 -> 3,1')).tolist() == [[1, 1, 1]]
+    assert rasterise(parse('5,2 -> 5,1')).tolist() == [[1], [1]]
+    assert rasterise(parse('0,0 -> 3,3')).tolist() == [[1, 0, 0, 0],
+                                                       [0, 1, 0, 0],
+                                                       [0, 0, 1, 0],
+                                                       [0, 0, 0, 1]]
+    assert rasterise(parse('2,2 -> 0,0')).tolist() == [[1, 0, 0], [0, 1, 0],
+                                                       [0, 0, 1]]
+    assert rasterise(parse('2,0 -> 0,2')).tolist() == [[0, 0, 1], [0, 1, 0],
+                                                       [1, 0, 0]]
+
+
+def test_rasterise():
+    grid = rasterise(parse(input_data))
+    assert '\n'.join(''.join(str(n) if n else '.' for n in row)
+                     for row in grid) == """1.1....11.
+.111...2..
+..2.1.111.
+...1.2.2..
+.112313211
+...1.2....
+..1...1...
+.1.....1..
+1.......1.
+222111...."""
+
+
+def test_count_overlaps_sparse():
+    segments = parse(input_data)
+    assert count_overlaps(segments, diagonals=False, dense_limit=0) == 5
+    assert count_overlaps(segments, diagonals=True, dense_limit=0) == 12
+    far = parse('0,0 -> 4,4\n4,0 -> 0,4\n0,2 -> 9,2\n'
+                '3000000000,0 -> 3000000000,5\n3000000000,5 -> 3000000000,9')
+    assert count_overlaps(far, diagonals=True) == 2
+    # Lines of more than one family, none of which cross.
+    apart = parse('0,0 -> 2,0\n5,1 -> 5,3')
+    assert count_overlaps(apart, diagonals=False, dense_limit=0) == 0
+    assert part1('0,0 -> 5000,0\n0,2 -> 0,3\n7000,5 -> 7000,6000') == 0
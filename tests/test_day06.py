@@ -1,4 +1,4 @@
-from aoc.day06 import part1, part2
+from aoc.day06 import lanternfish, model, part1, part2, project
 
 input_data = """3,4,3,1,2"""
 
@@ -9,3 +9,17 @@ def test_part1():
 
 def test_part2():
     assert part2(input_data) == 26984457539
+
+
+def test_project():
+    assert project(input_data, [18, 80, 256]) == [26, 5934, 26984457539]
+    assert project(input_data, [256], modulus=1000) == [539]
+    assert model(input_data, iterations=0) == 5
+
+
+def test_lanternfish_cache_is_bounded():
+    for modulus in range(2, 10):
+        project(input_data, [256], modulus)
+    assert lanternfish.cache_info().currsize <= 4
+    lanternfish.cache_clear()
+    assert lanternfish.cache_info().currsize == 0
@@ -1,4 +1,5 @@
-from aoc.day07 import part1, part2
+from aoc.day07 import (fuel_use, linear_costs, parse, part1, part2,
+                       triangle_costs, triangle_number)
 
 input_data = """16,1,2,0,4,2,7,1,2,14"""
 
@@ -9,3 +10,19 @@ def test_part1():
 
 def test_part2():
     assert part2(input_data) == 168
+
+
+def test_costs():
+    positions = parse(input_data)
+    linear = linear_costs(positions)
+    assert len(linear) == 17
+    assert linear[[1, 2, 3, 10]].tolist() == [41, 37, 39, 71]
+    triangle = triangle_costs(positions)
+    assert triangle[[2, 5]].tolist() == [206, 168]
+
+
+def test_fuel_use():
+    positions = parse(input_data)
+    assert fuel_use(positions) == 37
+    assert fuel_use(positions, triangle_number) == 168
+    assert fuel_use(positions, lambda d: d**2) == 291
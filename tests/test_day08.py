@@ -1,4 +1,8 @@
-from aoc.day08 import part1, part2
+from io import StringIO
+
+import pytest
+
+from aoc.day08 import decode, parse, part1, part2, read_chunks, sum_outputs
 
 input_data = """be cfbegad cbdgef fgaecd cgeb fdcge agebfd fecdb fabcd edb | fdgacbe cefdb cefbgd gcbe
 edbfga begcd cbg gc gcadebf fbgde acbgfd abcde gfcbed gfec | fcgedb cgb dgebacf gc
@@ -19,3 +23,23 @@ def test_part1():
 
 def test_part2():
     assert part2(input_data) == 61229
+
+
+def test_parse():
+    entries = parse(input_data)
+    assert entries.shape == (10, 14)
+    assert entries[0, :2].tolist() == [0b0010010, 0b1111111]
+    with pytest.raises(ValueError):
+        parse('ab cfbegad | gc ab')
+
+
+def test_decode():
+    assert decode(parse(input_data)).tolist() == [
+        8394, 9781, 1197, 9361, 4873, 8418, 4548, 1625, 8717, 4315
+    ]
+
+
+def test_read_chunks():
+    chunks = list(read_chunks(StringIO(input_data), chunk_size=100))
+    assert len(chunks) > 1
+    assert sum_outputs(chunks) == 61229
@@ -1,4 +1,7 @@
-from aoc.day09 import part1, part2
+import numpy as np
+
+from aoc.day09 import (basin_sizes, connected_components, low_points, parse,
+                       part1, part2)
 
 input_data = """2199943210
 3987894921
@@ -14,3 +17,20 @@ def test_part1():
 
 def test_part2():
     assert part2(input_data) == 1134
+
+
+def test_low_points():
+    heights = parse(input_data)
+    assert heights[low_points(heights)].tolist() == [1, 0, 5, 5]
+
+
+def test_basin_sizes():
+    assert sorted(basin_sizes(parse(input_data)).tolist()) == [3, 9, 9, 14]
+    # Runs that only join up through the row below them.
+    assert sorted(basin_sizes(
+        parse('09090\n00000\n99999\n09990'))) == [1, 1, 8]
+
+
+def test_connected_components():
+    u, v = np.array([4, 3, 1]), np.array([3, 2, 5])
+    assert connected_components(6, u, v).tolist() == [0, 1, 2, 2, 2, 1]
@@ -1,4 +1,6 @@
-from aoc.day10 import part1, part2
+from io import StringIO
+
+from aoc.day10 import RunningMedian, part1, part2, scan, score
 
 input_data = """[({(<(())[]>[[{[]{<()<>>
 [(()[<>])]({[<{<<[]>>(
@@ -19,3 +21,21 @@ def test_part1():
 
 def test_part2():
     assert part2(input_data) == 288957
+
+
+def test_scan():
+    assert scan('{([(<{}[<>[]}>{[]{[(<()>') == ('}', '')
+    assert scan('[({(<(())[]>[[{[]{<()<>>') == (None, '}}]])})]')
+    assert scan(')') == (')', '')
+    assert scan('()') == (None, '')
+
+
+def test_score():
+    assert score(StringIO(input_data)) == (26397, 288957)
+
+
+def test_running_median():
+    median = RunningMedian()
+    for n, expected in [(5, 5), (1, 3), (9, 5), (2, 3), (7, 5), (8, 6)]:
+        median.add(n)
+        assert median.median() == expected
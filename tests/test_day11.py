@@ -1,4 +1,4 @@
-from aoc.day11 import part1, part2
+from aoc.day11 import parse, part1, part2
 
 input_data = """5483143223
 2745854711
@@ -19,3 +19,19 @@ def test_part1():
 
 def test_part2():
     assert part2(input_data) == 195
+
+
+def test_step():
+    cave = parse('11111\n19991\n19191\n19991\n11111')
+    assert cave.step() == 9
+    assert cave.energy.tolist() == [[3, 4, 5, 4, 3], [4, 0, 0, 0, 4],
+                                    [5, 0, 0, 0, 5], [4, 0, 0, 0, 4],
+                                    [3, 4, 5, 4, 3]]
+    assert cave.step() == 0
+
+
+def test_first_sync():
+    assert parse(input_data).first_sync(max_steps=100) is None
+    assert parse(input_data).first_sync() == 195
+    # This cave settles into a cycle in which some octopuses never flash.
+    assert parse('990\n087\n636').first_sync() is None
@@ -1,4 +1,7 @@
-from aoc.day12 import part1, part2, is_large_cave, can_visit_part2
+import pytest
+
+from aoc.day12 import (compile_passages, count_paths, parse, part1, part2,
+                       is_large_cave)
 
 input_data_1 = """start-A
 start-b
@@ -59,3 +62,20 @@ def test_cave_is_lower():
     assert is_large_cave('BBBB')
     assert not is_large_cave('a')
     assert not is_large_cave('bbbb')
+
+
+def test_compile_passages():
+    passages = compile_passages(parse(input_data_1))
+    # start, end, b, c, d: A joins start, b, c and end to each other and
+    # themselves.
+    assert passages == [[(1, 1), (2, 2), (3, 1)], [],
+                        [(1, 2), (2, 1), (3, 1), (4, 1)],
+                        [(1, 1), (2, 1), (3, 1)], [(2, 1)]]
+    with pytest.raises(ValueError):
+        compile_passages(parse('start-A\nA-B\nB-end'))
+
+
+def test_count_paths():
+    passages = compile_passages(parse(input_data_3))
+    assert count_paths(passages, may_revisit=False) == 226
+    assert count_paths(passages, may_revisit=True) == 3509
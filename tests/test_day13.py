@@ -1,4 +1,8 @@
-from aoc.day13 import part1, part2, points_to_str, parse, collapse, Point, Line
+import numpy as np
+import pytest
+
+from aoc.day13 import (part1, part2, points_to_str, parse, fold, fold_all,
+                       reflect, Line)
 
 input_data = """6,10
 0,14
@@ -43,9 +47,9 @@ def test_print_grid():
 #.#........"""
 
 
-def test_collapse():
-    assert collapse(Point(3, 3), Line('x', 2)) == Point(1, 3)
-    assert collapse(Point(5, 4), Line('y', 2)) == Point(5, 0)
+def test_reflect():
+    assert reflect(np.array([3, 1, 2]), 2).tolist() == [1, 1, 2]
+    assert reflect(np.array([4]), 2).tolist() == [0]
 
 
 def test_part1():
@@ -58,3 +62,21 @@ def test_part2():
 #...#
 #...#
 #####"""
+
+
+def test_fold():
+    dots, folds = parse(input_data)
+    xs, ys = fold(dots, folds[0])
+    assert len(xs) == 17
+    assert (0, 0) in zip(xs.tolist(), ys.tolist())
+    assert all(y <= 7 for y in ys)
+
+
+def test_fold_all():
+    dots, folds = parse(input_data)
+    composed = fold_all(dots, folds)
+    one_by_one = fold(fold(dots, folds[0]), folds[1])
+    assert composed[0].tolist() == one_by_one[0].tolist()
+    assert composed[1].tolist() == one_by_one[1].tolist()
+    with pytest.raises(ValueError):
+        fold_all(dots, [Line('x', 2)])
@@ -1,4 +1,5 @@
-from aoc.day14 import part1, part2
+from aoc import day14
+from aoc.day14 import element_counts, parse, part1, part2, polymer
 
 input_data = """NNCB
 
@@ -27,3 +28,39 @@ def test_part1():
 
 def test_part2():
     assert part2(input_data) == 2188189693529
+
+
+def test_element_counts():
+    template, rules = parse(input_data)
+    counts = element_counts(template, rules, 10)
+    assert counts == {'B': 1749, 'C': 298, 'H': 161, 'N': 865}
+    assert sum(counts.values()) == 3073
+    modulo = element_counts(template, rules, 10, modulus=1000)
+    assert modulo == {'B': 749, 'C': 298, 'H': 161, 'N': 865}
+
+
+def test_element_counts_same_ends():
+    # Halving the count of each element in every pair miscounts when the
+    # polymer starts and ends with the same element.
+    counts = element_counts('ABA', {'AB': 'A', 'BA': 'B'}, 1)
+    assert counts == {'A': 3, 'B': 2}
+
+
+def test_polymer_cache_is_bounded():
+    template, rules = parse(input_data)
+    for modulus in range(2, 10):
+        element_counts(template, rules, 40, modulus)
+    assert polymer.cache_info().currsize <= 4
+    polymer.cache_clear()
+    assert polymer.cache_info().currsize == 0
+
+
+def test_element_counts_by_matrix_powers(monkeypatch):
+    template, rules = parse(input_data)
+    stepped = element_counts(template, rules, 40)
+    monkeypatch.setattr(day14, 'DIRECT_STEPS', 0)
+    assert element_counts(template, rules, 40) == stepped
+    assert element_counts(template, rules, 40, modulus=997) == {
+        e: n % 997
+        for e, n in stepped.items()
+    }
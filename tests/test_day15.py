@@ -1,4 +1,6 @@
-from aoc.day15 import part1, part2, grow_input
+import numpy as np
+
+from aoc.day15 import part1, part2, grow_input, parse, wrap, RiskMap
 
 input_data = """1163751742
 1381373672
@@ -36,3 +38,21 @@ def test_grow_input():
 12345
 23456
 34567"""
+
+
+def test_part1_single_cell():
+    assert part1(input_data_custom2) == 0
+
+
+def test_risk_map():
+    base = parse(input_data)
+    risks = RiskMap(base, tiles=5)
+    assert risks.shape == (50, 50)
+    cells = np.arange(len(risks))
+    rows, cols = np.divmod(cells, 50)
+    assert risks.risk(cells).tolist() == [
+        wrap(int(base[r % 10, c % 10]) + r // 10 + c // 10)
+        for r, c in zip(rows, cols)
+    ]
+    assert sorted(risks.neighbours(np.array(
+        [0, 51])).tolist()) == [1, 1, 50, 50, 52, 101]
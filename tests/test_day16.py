@@ -1,4 +1,6 @@
-from aoc.day16 import part1, part2, hex_to_bin, Packet
+import pytest
+
+from aoc.day16 import part1, part2, stream, BitReader, Packet
 
 
 def test_part1():
@@ -41,7 +43,7 @@ def test_part2():
 
 
 def test_literal():
-    bits = hex_to_bin('D2FE28')
+    bits = BitReader.from_hex('D2FE28').remainder()
     assert bits == '110100101111111000101000'
     p, remaining = Packet.parse(bits)
     assert p.version == 6
@@ -51,7 +53,7 @@ def test_literal():
 
 
 def test_bit_length_operator():
-    bits = hex_to_bin('38006F45291200')
+    bits = BitReader.from_hex('38006F45291200').remainder()
     assert bits == '00111000000000000110111101000101001010010001001000000000'
     p, remaining = Packet.parse(bits)
     assert p.version == 1
@@ -61,10 +63,35 @@ def test_bit_length_operator():
 
 
 def test_packet_length_operator():
-    bits = hex_to_bin('EE00D40C823060')
+    bits = BitReader.from_hex('EE00D40C823060').remainder()
     assert bits == '11101110000000001101010000001100100000100011000001100000'
     p, remaining = Packet.parse(bits)
     assert p.version == 7
     assert p.type_id == 3
     assert list(child.value for child in p.children) == [1, 2, 3]
     assert remaining == '00000'
+
+
+def test_bit_reader():
+    reader = BitReader.from_hex('D2FE28')
+    assert reader.read(3) == 6
+    assert reader.read(3) == 4
+    assert reader.read_literal() == 2021
+    assert reader.remainder() == '000'
+    assert reader.remainder() == ''
+    with pytest.raises(ValueError):
+        reader.read(1)
+    assert BitReader.from_hex('F').remainder() == '1111'
+
+
+def test_stream():
+    for hex_data in ('A0016C880162017C3686B18A3D4780',
+                     '9C0141080250320F1802104A08'):
+        root = Packet.read(BitReader.from_hex(hex_data))
+        expected = root.version_sum(), root.evaluate()
+        assert stream(BitReader.from_hex(hex_data)) == expected
+    # An equality of three literals.
+    with pytest.raises(ValueError):
+        stream(
+            BitReader.from_bits('000111' + '100000000011' + '000100' +
+                                '00001' * 3))
@@ -1,4 +1,6 @@
-from aoc.day17 import part1, part2
+import pytest
+
+from aoc.day17 import part1, part2, parse, hits_by_dy, hits_target
 
 input_data = """target area: x=20..30, y=-10..-5"""
 
@@ -9,3 +11,21 @@ def test_part1():
 
 def test_part2():
     assert part2(input_data) == 112
+
+
+def test_hits_by_dy():
+    target = parse(input_data)
+    dy, counts = hits_by_dy(target)
+    expected = {}
+    for y in range(-10, 10):
+        n = sum(hits_target(x, y, (0, 0), target) for x in range(1, 31))
+        if n:
+            expected[y] = n
+    assert dict(zip(dy.tolist(), counts.tolist())) == expected
+    with pytest.raises(ValueError):
+        hits_by_dy((-30, -20, -10, -5))
+
+
+def test_hits_target_deep_trajectory():
+    # Falls for about 10,000 steps, far more than the recursion limit.
+    assert hits_target(6, 4999, (0, 0), (20, 30, -5000, -4990))
@@ -1,4 +1,8 @@
-from aoc.day18 import part1, part2, SnailFishPair
+import pytest
+
+from aoc import day18
+from aoc.day18 import (part1, part2, largest_magnitude, parse, SnailFishNumber,
+                       SnailFishPair)
 
 input_data = """[[[0,[5,8]],[[1,7],[9,6]]],[[4,[1,2]],[[1,4],2]]]
 [[[5,[2,8]],4],[5,[[9,9],0]]]
@@ -114,3 +118,49 @@ def test_magnitude():
     for test_input, expected in tests.items():
         assert SnailFishPair.from_list(
             eval(test_input)).magnitude() == expected
+
+
+def test_flat_parse():
+    n = SnailFishNumber.parse('[[1,[15, 2]],3]')
+    assert n.values == [1, 15, 2, 3]
+    assert n.depths == [2, 3, 3, 1]
+    assert n.marshal() == [[1, [15, 2]], 3]
+    for bad in ('[1,2', '[1,2]]', '__import__("os")', '[1,x]', ''):
+        with pytest.raises(ValueError):
+            SnailFishNumber.parse(bad)
+
+
+def test_flat_reduce():
+    n = SnailFishNumber.parse('[[[[[4,3],4],4],[7,[[8,4],9]]],[1,1]]')
+    n.reduce()
+    assert n.marshal() == [[[[0, 7], 4], [[7, 8], [6, 0]]], [8, 1]]
+
+
+def test_flat_add():
+    a = SnailFishNumber.parse('[[[0,[4,5]],[0,0]],[[[4,5],[2,6]],[9,5]]]')
+    b = SnailFishNumber.parse('[7,[[[3,7],[4,3]],[[6,3],[8,8]]]]')
+    total = SnailFishNumber.add(a, b)
+    assert total.marshal() == eval(
+        '[[[[4,0],[5,4]],[[7,7],[6,0]]],[[8,[7,7]],[[7,9],[5,0]]]]')
+    assert total.magnitude() == SnailFishPair.from_list(
+        total.marshal()).magnitude()
+    # The operands are left as they were.
+    assert a.marshal() == eval('[[[0,[4,5]],[0,0]],[[[4,5],[2,6]],[9,5]]]')
+
+
+def test_flat_pack():
+    n = SnailFishNumber.parse('[[1,[9,2]],3]')
+    assert SnailFishNumber.unpack(n.pack()) == n
+
+
+def test_largest_magnitude_on_one_cpu(monkeypatch):
+    monkeypatch.setattr(day18.os, 'cpu_count', lambda: 1)
+    monkeypatch.setattr(day18, 'ProcessPoolExecutor', None)
+    assert largest_magnitude(parse(input_data), jobs=0) == 3993
+
+
+def test_largest_magnitude_in_parallel():
+    numbers = parse(input_data)
+    assert largest_magnitude(numbers, jobs=2) == 3993
+    assert largest_magnitude(numbers[:2],
+                             jobs=4) == largest_magnitude(numbers[:2])
@@ -0,0 +1,128 @@
+import importlib
+
+import pytest
+
+from aoc import day03, day11, day16
+from aoc.day16 import BitReader, Packet
+from aoc.day23 import parse as parse_burrow
+from aoc.day24 import Execution
+from aoc.generators import generate
+
+small = {
+    1: {},
+    2: {},
+    3: {},
+    4: {
+        'n_boards': 20
+    },
+    5: {
+        'n': 50,
+        'size': 50
+    },
+    6: {},
+    7: {
+        'n': 100
+    },
+    8: {
+        'n': 20
+    },
+    9: {
+        'rows': 20,
+        'cols': 20
+    },
+    10: {
+        'n': 21
+    },
+    12: {},
+    13: {},
+    14: {},
+    15: {
+        'rows': 20,
+        'cols': 20
+    },
+    16: {},
+    17: {},
+    18: {
+        'n': 10
+    },
+    19: {
+        'n_scanners': 2
+    },
+    20: {
+        'rows': 10,
+        'cols': 10
+    },
+    21: {},
+    22: {
+        'n': 30
+    },
+}
+
+# Part 2 of these days takes seconds whatever the input size.
+slow_part2 = {20, 21}
+
+
+@pytest.mark.parametrize('day', small)
+def test_generated_inputs_solve(day):
+    module = importlib.import_module(f'aoc.day{day:02d}')
+    input_data = generate(day, **small[day])
+    assert input_data == generate(day, **small[day])
+    assert input_data != generate(day, seed=1, **small[day])
+    assert module.part1(input_data) is not None
+    if day not in slow_part2:
+        assert module.part2(input_data) is not None
+
+
+def test_day03_ratings_are_defined():
+    for seed in range(10):
+        input_data = generate(3, n=50, width=6, seed=seed)
+        assert len(set(input_data.splitlines())) == 50
+        assert isinstance(day03.part2(input_data), int)
+
+
+def test_day11():
+    input_data = generate(11)
+    assert day11.part1(input_data) == 1384
+    # Random grids need not ever synchronise, but this one does.
+    assert day11.part2(input_data) == 73
+
+
+def test_day16_nesting():
+    packet = Packet.read(
+        BitReader.from_hex(generate(16, n_packets=10, depth=30)))
+    depth = 0
+    while packet.children:
+        packet = packet.children[0]
+        depth += 1
+    assert depth == 30
+
+
+def test_day16_deeper_than_recursion_limit():
+    input_data = generate(16, n_packets=3000, depth=3000)
+    assert day16.part1(input_data) > 0
+    assert day16.part2(input_data) >= 0
+
+
+def test_day23():
+    rooms = parse_burrow(generate(23), part=1)
+    assert sorted(a for room in rooms
+                  for a in room) == [0, 0, 1, 1, 2, 2, 3, 3]
+
+
+def test_day24_has_a_valid_model_number():
+    program = generate(24, n_digits=6).splitlines()
+    blocks = [program[i:i + 18] for i in range(0, len(program), 18)]
+    digits = [0] * len(blocks)
+    stack = []
+    for j, block in enumerate(blocks):
+        divisor, check, offset = (int(block[i].split()[-1])
+                                  for i in (4, 5, 15))
+        if divisor == 1:
+            stack.append((j, offset))
+        else:
+            i, pushed_offset = stack.pop()
+            difference = pushed_offset + check
+            digits[i] = max(1, 1 - difference)
+            digits[j] = digits[i] + difference
+    model_number = ''.join(map(str, digits))
+    assert Execution(program, model_number).execute()['z'] == 0
@@ -0,0 +1,51 @@
+import pytest
+
+from aoc.inputs import InputStore, Puzzle, digest
+
+
+def test_put_and_read(tmp_path):
+    store = InputStore(tmp_path)
+    assert 1 not in store
+    content_digest = store.put(1, '199\n200\n')
+    assert content_digest == digest(b'199\n200\n')
+    assert 1 in store
+    assert (1, 2021) in store
+    assert store.path(1) == tmp_path / '2021' / 'day01.txt'
+    assert store.read_bytes(1) == b'199\n200\n'
+    assert store.read_text(1) == '199\n200'
+
+
+def test_verify(tmp_path):
+    store = InputStore(tmp_path)
+    assert not store.verify(5)
+    store.put(5, '0,9 -> 5,9')
+    assert store.verify(5)
+    store.path(5).write_text('0,9 -> 5,8')
+    assert not store.verify(5)
+
+
+def test_open_mmap(tmp_path):
+    store = InputStore(tmp_path)
+    store.put(16, 'D2FE28')
+    with store.open_mmap(16) as m:
+        assert m[:2] == b'D2'
+        assert bytes(m) == b'D2FE28'
+    store.put(16, '')
+    with store.open_mmap(16) as m:
+        assert m == b''
+
+
+def test_puzzle(tmp_path):
+    store = InputStore(tmp_path)
+    store.put(6, '3,4,3,1,2\n')
+    assert Puzzle(2021, 6, store).input_data == '3,4,3,1,2'
+    with pytest.raises(FileNotFoundError):
+        _ = Puzzle(2021, 7, store, offline=True).input_data
+
+
+def test_default_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.delenv('AOC_CACHE_DIR', raising=False)
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+    assert InputStore().root == tmp_path / 'aoc'
+    monkeypatch.setenv('AOC_CACHE_DIR', str(tmp_path / 'inputs'))
+    assert InputStore().root == tmp_path / 'inputs'
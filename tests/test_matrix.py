@@ -0,0 +1,24 @@
+from aoc.matrix import MatrixPowers
+
+fibonacci = [[1, 1], [1, 0]]
+
+
+def test_power():
+    powers = MatrixPowers(fibonacci)
+    assert powers.power(0).tolist() == [[1, 0], [0, 1]]
+    assert powers.power(10).tolist() == [[89, 55], [55, 34]]
+    assert powers.power(300)[
+        0,
+        1] == 222232244629420445529739893461909967206666939096499764990979600
+
+
+def test_apply():
+    powers = MatrixPowers(fibonacci)
+    assert powers.apply(10, [1, 0]).tolist() == [89, 55]
+    assert powers.apply(0, [2, 3]).tolist() == [2, 3]
+
+
+def test_modulus():
+    powers = MatrixPowers(fibonacci, modulus=1000)
+    assert powers.apply(300, [1, 0])[1] == 600
+    assert powers.power(10**18).max() < 1000
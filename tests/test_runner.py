@@ -0,0 +1,95 @@
+from aoc.__main__ import day_list, main
+from aoc.inputs import InputStore
+from aoc.runner import (TimingHistory, discover_days, profile_part, run,
+                        schedule)
+
+depths = """199
+200
+208
+210
+200
+207
+240
+269
+260
+263
+"""
+
+
+def test_discover_days():
+    days = discover_days()
+    assert list(days) == list(range(1, 25))
+    assert days[1] == 'aoc.day01'
+
+
+def test_day_list():
+    assert day_list('1') == [1]
+    assert day_list('1,3-5') == [1, 3, 4, 5]
+
+
+def test_profile_part():
+    result = profile_part(1, 1, lambda s: len(s), 'abc')
+    assert result.ok
+    assert result.answer == 3
+    assert result.wall_time >= 0
+    assert result.peak_rss > 0
+    assert result.tracemalloc_peak is not None
+
+
+def test_profile_part_records_errors():
+    result = profile_part(1, 1, lambda s: 1 // 0, '')
+    assert not result.ok
+    assert result.error.startswith('ZeroDivisionError')
+
+
+def test_run(tmp_path):
+    (tmp_path / 'day01.txt').write_text(depths)
+    results = run([1], input_dir=tmp_path, trace_memory=False)
+    assert [(r.day, r.part, r.answer) for r in results] == [(1, 1, 7),
+                                                            (1, 2, 5)]
+    assert all(r.tracemalloc_peak is None for r in results)
+
+
+def test_run_missing_input(tmp_path):
+    results = run([2], parts=[1], input_dir=tmp_path)
+    assert not results[0].ok
+    assert 'day02.txt' in results[0].error
+
+
+def test_run_from_store(tmp_path):
+    store = InputStore(tmp_path)
+    store.put(1, depths)
+    results = run([1, 2], parts=[1], store=store, offline=True)
+    assert results[0].answer == 7
+    assert not results[1].ok
+    assert 'not cached' in results[1].error
+
+
+def test_run_parallel(tmp_path):
+    (tmp_path / 'day01.txt').write_text(depths)
+    history = TimingHistory(tmp_path / 'timings.json')
+    results = run([3, 1], input_dir=tmp_path, jobs=2, history=history)
+    assert [(r.day, r.part) for r in results] == [(3, 1), (3, 2), (1, 1),
+                                                  (1, 2)]
+    assert [r.answer for r in results[2:]] == [7, 5]
+    assert not results[0].ok
+    saved = TimingHistory(tmp_path / 'timings.json')
+    assert saved.expected(1, 2) == results[3].wall_time
+    assert saved.expected(3, 1) is None
+
+
+def test_schedule(tmp_path):
+    history = TimingHistory(tmp_path / 'timings.json')
+    history.timings = {'day01.part1': 0.1, 'day15.part2': 10.0}
+    tasks = [(1, 1, ''), (2, 1, ''), (15, 2, '')]
+    assert schedule(tasks, history) == [(2, 1, ''), (15, 2, ''), (1, 1, '')]
+
+
+def test_main(tmp_path, capsys, monkeypatch):
+    monkeypatch.setenv('AOC_CACHE_DIR', str(tmp_path / 'cache'))
+    (tmp_path / 'day01.txt').write_text(depths)
+    assert main(['run', '1', '-p', '2', '-i', str(tmp_path)]) == 0
+    out = capsys.readouterr().out
+    assert out.splitlines()[1].split()[:2] == ['1', '2']
+    assert out.splitlines()[1].endswith(' 5')
+    assert main(['run', '1', '-i', str(tmp_path), '--max-time', '-1']) == 1